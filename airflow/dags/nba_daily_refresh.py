@@ -4,7 +4,7 @@ NBA Daily Refresh DAG
 Daily orchestration of NBA data pipeline:
 1. Extract previous day's games and player stats
 2. Load into staging tables
-3. Run dbt transformations
+3. Build and test dbt models (skipped when no new staging data arrived)
 4. Update materialized views
 5. Run data quality checks
 6. Refresh ML model predictions
@@ -13,28 +13,45 @@ Schedule: Daily at 2 AM EST (after games conclude)
 """
 
 import os
+import queue
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from airflow.operators.bash import BashOperator
-from airflow.operators.python import PythonOperator
+from airflow.operators.python import PythonOperator, ShortCircuitOperator
 from airflow.providers.postgres.hooks.postgres import PostgresHook
 from airflow.providers.postgres.operators.postgres import PostgresOperator
 from airflow.utils.dates import days_ago
 
 from airflow import DAG
+from parquet_xcom_backend import (
+    ParquetXComBackend,
+    cache_uri,
+    cached_reference,
+    iter_record_batches,
+    read_record_frame,
+    write_record_batches,
+)
 
 sys.path.insert(0, os.path.abspath("/opt/airflow"))
 
 from src.analytics.metrics import calculate_advanced_metrics
 from src.etl.extractors.nba_extractor import NBAExtractor
-from src.etl.loaders.postgres_loader import PostgresLoader
+from src.etl.loaders.postgres_loader import PLAYER_STATS_STAGING_SCHEMA, PostgresLoader
 from src.etl.transformers.nba_transformer import NBATransformer
 from src.utils.data_quality import run_data_quality_checks
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Concurrent box score requests per extraction (bounded by the extractor rate limit)
+MAX_EXTRACT_WORKERS = 8
+
+# Batches buffered between overlapping pipeline stages (bounds memory)
+PREFETCH_BATCHES = 4
+
 # Default arguments
 default_args = {
     "owner": "nba-analytics",
@@ -45,6 +62,8 @@ default_args = {
     "email_on_retry": False,
     "retries": 3,
     "retry_delay": timedelta(minutes=5),
+    "retry_exponential_backoff": True,
+    "max_retry_delay": timedelta(minutes=30),
     "execution_timeout": timedelta(hours=2),
 }
 
@@ -60,6 +79,32 @@ dag = DAG(
 )
 
 
+def iter_player_stats(extractor, game_ids, failed_games):
+    """Yield player stats one game at a time, fetching games concurrently"""
+    with ThreadPoolExecutor(max_workers=MAX_EXTRACT_WORKERS) as executor:
+        futures = [
+            (game_id, executor.submit(extractor.get_player_game_stats, game_id))
+            for game_id in game_ids
+        ]
+
+        for game_id, future in futures:
+            try:
+                player_stats = future.result()
+            except Exception as e:
+                logger.error(f"Failed to extract stats for game {game_id}: {str(e)}")
+                failed_games.append(game_id)
+                continue  # Skip this game but continue with others
+
+            if not player_stats:  # Empty list returned
+                logger.warning(
+                    f"No stats available for game {game_id} - may not be finished yet"
+                )
+                failed_games.append(game_id)
+                continue
+
+            yield player_stats
+
+
 def extract_yesterday_games(**context):
     """Extract all games and player stats from yesterday"""
     logger.info("Starting daily extraction for yesterday's games")
@@ -67,36 +112,53 @@ def extract_yesterday_games(**context):
     execution_date = context["execution_date"]
     target_date = (execution_date - timedelta(days=1)).strftime("%Y-%m-%d")
 
+    ti = context["task_instance"]
+    games_uri = cache_uri(f"games_{target_date}")
+    player_stats_uri = cache_uri(f"player_stats_{target_date}")
+
+    # Finished games don't change: reuse a complete earlier extraction instead
+    # of calling the API again when the run is cleared or retried
+    games_ref, games_count = cached_reference(games_uri)
+    player_stats_ref, player_stats_count = cached_reference(player_stats_uri, batched=True)
+
+    if games_ref and player_stats_ref:
+        logger.info(
+            f"Using cached extraction for {target_date}: "
+            f"{games_count} games, {player_stats_count} player-game records"
+        )
+        ti.xcom_push(key="games", value=games_ref)
+        ti.xcom_push(key="player_stats", value=player_stats_ref)
+
+        return {
+            "date": target_date,
+            "games_count": games_count,
+            "player_stats_count": player_stats_count,
+            "failed_games": 0,
+            "cached": True,
+        }
+
     extractor = NBAExtractor()
 
     # Extract game data
     games = extractor.get_games_by_date(target_date)
     logger.info(f"Extracted {len(games)} games for {target_date}")
 
-    # Extract player stats for each game
-    all_player_stats = []
-    failed_games = []
-
-    for game in games:
-        game_id = game["GAME_ID"]
-        try:
-            player_stats = extractor.get_player_game_stats(game_id)
+    # LeagueGameFinder returns one row per team, so each game appears twice
+    game_ids = list(dict.fromkeys(game["GAME_ID"] for game in games))
 
-            if not player_stats:  # Empty list returned
-                logger.warning(
-                    f"No stats available for game {game_id} - may not be finished yet"
-                )
-                failed_games.append(game_id)
-                continue
-
-            all_player_stats.extend(player_stats)
+    # Stream player stats game by game straight into a Parquet file so the
+    # worker never holds the full set of player-game records in memory.
+    # Box scores are fetched per game: the single-call PlayerGameLogs date query
+    # lacks position, jersey number, DNP rows and the advanced box score fields.
+    failed_games = []
 
-        except Exception as e:
-            logger.error(f"Failed to extract stats for game {game_id}: {str(e)}")
-            failed_games.append(game_id)
-            continue  # Skip this game but continue with others
+    player_stats_ref, player_stats_count = write_record_batches(
+        iter_player_stats(extractor, game_ids, failed_games),
+        player_stats_uri,
+        batched=True,
+    )
 
-    logger.info(f"Extracted stats for {len(all_player_stats)} player-game records")
+    logger.info(f"Extracted stats for {player_stats_count} player-game records")
 
     if failed_games:
         logger.warning(
@@ -104,23 +166,88 @@ def extract_yesterday_games(**context):
         )
 
     # Don't fail the entire DAG if some games are missing
-    if len(all_player_stats) == 0 and len(games) > 0:
+    if player_stats_count == 0 and len(game_ids) > 0:
         raise ValueError(
-            f"No player stats available for any of {len(games)} games - they may not be finished yet"
+            f"No player stats available for any of {len(game_ids)} games - they may not be finished yet"
         )
 
-    # Push data to XCom for next task
-    context["task_instance"].xcom_push(key="games", value=games)
-    context["task_instance"].xcom_push(key="player_stats", value=all_player_stats)
+    # Only cache complete extractions; the games file is written last and
+    # marks the cached player stats as complete
+    if player_stats_ref and not failed_games:
+        games_ref, _ = write_record_batches([games], games_uri)
+
+    # Push data to XCom for next task (player stats as a batched reference,
+    # read one game per row group downstream)
+    ti.xcom_push(key="games", value=games_ref or games)
+    ti.xcom_push(key="player_stats", value=player_stats_ref or [])
 
     return {
         "date": target_date,
         "games_count": len(games),
-        "player_stats_count": len(all_player_stats),
+        "player_stats_count": player_stats_count,
         "failed_games": len(failed_games),
+        "cached": False,
     }
 
 
+def iter_prefetched(batches, maxsize=PREFETCH_BATCHES):
+    """
+    Yield batches while a background thread already produces the next ones.
+
+    Stages chained this way overlap (e.g. Parquet reads, transforms and writes)
+    instead of running one after another; the bounded queue applies
+    backpressure. Producer errors are re-raised in the consumer, and the end
+    sentinel is always queued, so the consumer can't wait forever on a
+    producer that died.
+    """
+    buffer = queue.Queue(maxsize=maxsize)
+    done = object()
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for batch in batches:
+                if not put(batch):
+                    return
+        except BaseException as e:
+            put(e)
+        finally:
+            put(done)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is done:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # Unblock the producer if the consumer stops early
+        stop.set()
+        producer.join()
+
+
+def iter_transformed_player_stats(transformer, player_stats):
+    """Yield transformed player stats with advanced metrics, one batch at a time"""
+    for batch in iter_prefetched(iter_record_batches(player_stats)):
+        # Stays columnar from transformation through the metrics kernel
+        transformed = transformer.transform_player_stats(batch, as_frame=True)
+        if not transformed.empty:
+            yield calculate_advanced_metrics(transformed).to_dict("records")
+
+
 def transform_data(**context):
     """Transform raw data into clean, validated format"""
     logger.info("Starting data transformation")
@@ -135,23 +262,43 @@ def transform_data(**context):
     # Transform games
     transformed_games = transformer.transform_games(games)
 
-    # Transform player stats
-    transformed_player_stats = transformer.transform_player_stats(player_stats)
-
-    # Calculate advanced metrics
-    enhanced_player_stats = calculate_advanced_metrics(transformed_player_stats)
+    # Transform player stats one row group (game) at a time, calculating
+    # advanced metrics as vectorized column operations per batch. Each game is
+    # a few milliseconds of CPU, so this stays one task rather than a mapped
+    # task per game (which would add a scheduler round trip and XCom row each).
+    # Reading, transforming and writing run in their own threads, overlapping:
+    # - iter_transformed_player_stats' inner iter_prefetched thread reads
+    #   Parquet row groups;
+    # - the outer iter_prefetched thread below runs that generator, i.e.
+    #   transforms batches and computes their metrics;
+    # - this task thread, in write_record_batches, writes the results.
+    # Each hand-off is a bounded queue, so at most PREFETCH_BATCHES batches
+    # wait between two stages.
+    transformed_stats_ref, transformed_stats_count = write_record_batches(
+        iter_prefetched(iter_transformed_player_stats(transformer, player_stats)),
+        ParquetXComBackend.build_uri(
+            key="transformed_player_stats",
+            task_id=ti.task_id,
+            dag_id=ti.dag_id,
+            run_id=context["run_id"],
+            map_index=ti.map_index,
+        ),
+        batched=True,
+        # Pinned so columns that are all null in the first game keep their types
+        schema=PLAYER_STATS_STAGING_SCHEMA,
+    )
 
     logger.info(
-        f"Transformed {len(transformed_games)} games and {len(enhanced_player_stats)} player records"
+        f"Transformed {len(transformed_games)} games and {transformed_stats_count} player records"
     )
 
     # Push transformed data to XCom
     ti.xcom_push(key="transformed_games", value=transformed_games)
-    ti.xcom_push(key="transformed_player_stats", value=enhanced_player_stats)
+    ti.xcom_push(key="transformed_player_stats", value=transformed_stats_ref or [])
 
     return {
         "transformed_games": len(transformed_games),
-        "transformed_player_stats": len(enhanced_player_stats),
+        "transformed_player_stats": transformed_stats_count,
     }
 
 
@@ -162,8 +309,9 @@ def load_to_staging(**context):
     # Pull transformed data from XCom
     ti = context["task_instance"]
     games = ti.xcom_pull(key="transformed_games", task_ids="transform_data")
-    player_stats = ti.xcom_pull(
-        key="transformed_player_stats", task_ids="transform_data"
+    # Player stats are read straight from Parquet into a columnar DataFrame
+    player_stats = read_record_frame(
+        ti.xcom_pull(key="transformed_player_stats", task_ids="transform_data")
     )
 
     loader = PostgresLoader()
@@ -179,6 +327,19 @@ def load_to_staging(**context):
     return {"games_loaded": games_loaded, "stats_loaded": stats_loaded}
 
 
+def check_new_staging_data(**context):
+    """Short-circuit downstream rebuilds when no new rows reached staging"""
+    load_result = context["task_instance"].xcom_pull(task_ids="load_to_staging") or {}
+    rows_loaded = load_result.get("games_loaded", 0) + load_result.get("stats_loaded", 0)
+
+    if rows_loaded == 0:
+        logger.info("No new staging data - skipping dbt build and statistics refresh")
+        return False
+
+    logger.info(f"{rows_loaded} new staging rows - continuing with dbt build")
+    return True
+
+
 def validate_data_quality(**context):
     """Run comprehensive data quality checks"""
     logger.info("Running data quality validation")
@@ -202,35 +363,39 @@ def validate_data_quality(**context):
 extract_task = PythonOperator(
     task_id="extract_yesterday_games",
     python_callable=extract_yesterday_games,
-    provide_context=True,
+    pool="nba_api_pool",
+    # A daily slate is ~15 games; a hung API call should fail fast and retry
+    execution_timeout=timedelta(minutes=30),
     dag=dag,
 )
 
 transform_task = PythonOperator(
     task_id="transform_data",
     python_callable=transform_data,
-    provide_context=True,
     dag=dag,
 )
 
 load_task = PythonOperator(
     task_id="load_to_staging",
     python_callable=load_to_staging,
-    provide_context=True,
+    pool="db_load_pool",
     dag=dag,
 )
 
-# dbt run - transform staging to marts
-dbt_run_task = BashOperator(
-    task_id="dbt_run",
-    bash_command="cd /opt/airflow/dbt && dbt run --profiles-dir /home/airflow/.dbt",
+# Skip dbt / quality / statistics tasks on days without new data
+new_data_check_task = ShortCircuitOperator(
+    task_id="check_new_staging_data",
+    python_callable=check_new_staging_data,
     dag=dag,
 )
 
-# dbt test - validate data
-dbt_test_task = BashOperator(
-    task_id="dbt_test",
-    bash_command="cd /opt/airflow/dbt && dbt test --profiles-dir /home/airflow/.dbt",
+# dbt build - run and test models in dependency order with a single dbt invocation
+dbt_build_task = BashOperator(
+    task_id="dbt_build",
+    bash_command=(
+        "cd /opt/airflow/dbt && "
+        "dbt build --target prod_nightly --threads 8 --profiles-dir /home/airflow/.dbt"
+    ),
     dag=dag,
 )
 
@@ -238,23 +403,39 @@ dbt_test_task = BashOperator(
 quality_check_task = PythonOperator(
     task_id="validate_data_quality",
     python_callable=validate_data_quality,
-    provide_context=True,
     dag=dag,
 )
 
-# Update statistics for query optimization
-update_stats_task = PostgresOperator(
-    task_id="update_table_statistics",
-    postgres_conn_id="nba_postgres",
-    sql="""
-        ANALYZE public_dwh.fact_player_game_stats;
-        ANALYZE public_dwh.fact_team_game_stats;
-        ANALYZE public_dwh.dim_players;
-        ANALYZE public_dwh.dim_teams;
-        ANALYZE public_analytics.player_season_stats;
-    """,
-    dag=dag,
-)
+# Update statistics for query optimization, one task (and backend) per table
+# so the scans run in parallel. Fact tables get a parallel VACUUM ANALYZE;
+# VACUUM cannot run inside a transaction, hence autocommit.
+TABLE_STATISTICS_SQL = {
+    "fact_player_game_stats": [
+        "SET max_parallel_maintenance_workers = 4",
+        "VACUUM (ANALYZE, PARALLEL 4) public_dwh.fact_player_game_stats",
+    ],
+    "fact_team_game_stats": [
+        "SET max_parallel_maintenance_workers = 4",
+        "VACUUM (ANALYZE, PARALLEL 4) public_dwh.fact_team_game_stats",
+    ],
+    # Small tables share one task
+    "dimensions_and_marts": [
+        "ANALYZE public_dwh.dim_players, public_dwh.dim_teams, public_analytics.player_season_stats",
+    ],
+}
+
+update_stats_tasks = [
+    PostgresOperator(
+        task_id=f"update_table_statistics_{name}",
+        postgres_conn_id="nba_postgres",
+        sql=statements,
+        autocommit=True,
+        pool="db_maintenance_pool",
+        dag=dag,
+    )
+    for name, statements in TABLE_STATISTICS_SQL.items()
+]
+
 # Define task dependencies
-extract_task >> transform_task >> load_task >> dbt_run_task >> dbt_test_task
-dbt_test_task >> quality_check_task >> update_stats_task
+extract_task >> transform_task >> load_task >> new_data_check_task >> dbt_build_task
+dbt_build_task >> quality_check_task >> update_stats_tasks
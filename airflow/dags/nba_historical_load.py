@@ -67,6 +67,7 @@ def load_season_data(**context):
 load_task = PythonOperator(
     task_id="load_historical_data",
     python_callable=load_season_data,
+    pool="nba_api_pool",
     provide_context=True,
     dag=dag,
 )
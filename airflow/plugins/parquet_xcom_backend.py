@@ -0,0 +1,274 @@
+"""
+Parquet XCom Backend
+====================
+Custom XCom backend that keeps large record payloads out of the Airflow
+metadata database.
+
+Lists of records (``List[Dict]``) pushed by the NBA pipeline tasks are written
+as Parquet files to shared storage and only a short reference URI is stored in
+the ``xcom`` table. All other values (task summaries, counters, ...) go through
+the default JSON serialization untouched.
+
+Tasks producing large outputs can also stream them batch by batch with
+``write_record_batches`` (one Parquet row group per batch) and push the returned
+reference, which downstream tasks resolve exactly like a regular record list.
+``cache_uri`` / ``cached_reference`` address run-independent artifacts that can
+be reused across DAG runs and task retries.
+
+Batched references (``batched=True``) are not resolved on pull. Consumers read
+them one row group at a time with ``iter_record_batches`` or as a single
+columnar DataFrame with ``read_record_frame``, so large payloads never have to
+be materialized as one list of dictionaries.
+
+Enable with:
+    AIRFLOW__CORE__XCOM_BACKEND=parquet_xcom_backend.ParquetXComBackend
+
+Storage location is controlled by ``NBA_XCOM_STORAGE_URI`` and accepts any
+URI understood by ``pyarrow.fs`` (``file:///opt/airflow/xcom``, ``s3://nba-xcom``).
+"""
+
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+from airflow.models.xcom import BaseXCom
+
+XCOM_STORAGE_URI = os.getenv("NBA_XCOM_STORAGE_URI", "file:///opt/airflow/xcom")
+REFERENCE_PREFIX = "parquet-xcom://"
+BATCH_REFERENCE_PREFIX = "parquet-xcom-batches://"
+
+
+def _is_record_list(value: Any) -> bool:
+    """Check whether a value is a non-empty list of dictionaries."""
+    return isinstance(value, list) and len(value) > 0 and isinstance(value[0], dict)
+
+
+def _promote_null_fields(schema: pa.Schema) -> pa.Schema:
+    """Replace all-null columns inferred from the first batch with nullable strings."""
+    for index, field in enumerate(schema):
+        if pa.types.is_null(field.type):
+            schema = schema.set(index, field.with_type(pa.string()))
+    return schema
+
+
+def _conform_column(column: pa.ChunkedArray, field: pa.Field) -> pa.ChunkedArray:
+    """Cast one batch column to its file type, refusing casts that change values."""
+    if column.type == field.type or pa.types.is_null(column.type):
+        return column.cast(field.type)
+
+    # Text columns only take text; numbers would silently be stored as strings
+    if pa.types.is_string(field.type) and not pa.types.is_string(column.type):
+        raise ValueError(
+            f"Column '{field.name}' is {column.type} in this batch but stored as "
+            f"{field.type} (all null in the first batch?); pass an explicit schema"
+        )
+
+    # Records built from DataFrames mark missing numbers as NaN
+    if pa.types.is_floating(column.type) and pa.types.is_integer(field.type):
+        column = pc.if_else(pc.is_nan(column), pa.scalar(None, column.type), column)
+
+    try:
+        return column.cast(field.type)
+    except pa.ArrowInvalid as e:
+        raise ValueError(
+            f"Column '{field.name}' cannot be stored as {field.type} without losing data: {e}"
+        ) from e
+
+
+def _conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Cast a batch to the file schema, adding missing columns as nulls."""
+    unknown = [name for name in table.column_names if schema.get_field_index(name) < 0]
+    if unknown:
+        raise ValueError(f"Columns {unknown} are not in the file schema {schema.names}")
+
+    columns = [
+        (
+            _conform_column(table.column(field.name), field)
+            if field.name in table.column_names
+            else pa.nulls(table.num_rows, field.type)
+        )
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _reference(uri: str, batched: bool) -> str:
+    """Build the XCom reference string for a Parquet artifact."""
+    return f"{BATCH_REFERENCE_PREFIX if batched else REFERENCE_PREFIX}{uri}"
+
+
+def _open_batch_reference(value: str) -> Tuple[pafs.FileSystem, str]:
+    """Resolve a batched reference into its filesystem and path."""
+    return pafs.FileSystem.from_uri(value[len(BATCH_REFERENCE_PREFIX) :])
+
+
+def _is_batch_reference(value: Any) -> bool:
+    """Check whether a pulled XCom value is a batched Parquet reference."""
+    return isinstance(value, str) and value.startswith(BATCH_REFERENCE_PREFIX)
+
+
+class ParquetXComBackend(BaseXCom):
+    """Stores record lists as Parquet files and passes only their URI through XCom."""
+
+    @staticmethod
+    def build_uri(
+        key: Optional[str],
+        task_id: Optional[str],
+        dag_id: Optional[str],
+        run_id: Optional[str],
+        map_index: Optional[int],
+    ) -> str:
+        """Build a deterministic storage URI for an XCom value."""
+        file_name = key or "return_value"
+        if map_index is not None and map_index >= 0:
+            file_name = f"{file_name}_{map_index}"
+
+        return f"{XCOM_STORAGE_URI.rstrip('/')}/{dag_id}/{run_id}/{task_id}/{file_name}.parquet"
+
+    @staticmethod
+    def serialize_value(
+        value: Any,
+        *,
+        key: Optional[str] = None,
+        task_id: Optional[str] = None,
+        dag_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        map_index: Optional[int] = None,
+    ):
+        """Write record lists to Parquet and serialize only the reference URI."""
+        if _is_record_list(value):
+            uri = ParquetXComBackend.build_uri(key, task_id, dag_id, run_id, map_index)
+            filesystem, path = pafs.FileSystem.from_uri(uri)
+            filesystem.create_dir(os.path.dirname(path), recursive=True)
+
+            pq.write_table(pa.Table.from_pylist(value), path, filesystem=filesystem)
+            value = _reference(uri, batched=False)
+
+        return BaseXCom.serialize_value(
+            value,
+            key=key,
+            task_id=task_id,
+            dag_id=dag_id,
+            run_id=run_id,
+            map_index=map_index,
+        )
+
+    @staticmethod
+    def deserialize_value(result) -> Any:
+        """Resolve Parquet references back into record lists."""
+        value = BaseXCom.deserialize_value(result)
+
+        if isinstance(value, str) and value.startswith(REFERENCE_PREFIX):
+            filesystem, path = pafs.FileSystem.from_uri(value[len(REFERENCE_PREFIX) :])
+            value = pq.read_table(path, filesystem=filesystem).to_pylist()
+
+        return value
+
+
+def cache_uri(name: str) -> str:
+    """Build the storage URI of a named, run-independent artifact (e.g. ``games_2024-12-15``)."""
+    return f"{XCOM_STORAGE_URI.rstrip('/')}/cache/{name}.parquet"
+
+
+def cached_reference(uri: str, batched: bool = False) -> Tuple[Optional[str], int]:
+    """
+    Look up an existing Parquet artifact.
+
+    Args:
+        uri: Artifact URI, usually from ``cache_uri``
+        batched: Return a batched reference instead of a resolved one
+
+    Returns:
+        Tuple of (XCom reference to push, row count), or (None, 0) if the file
+        does not exist. Only the Parquet footer is read.
+    """
+    filesystem, path = pafs.FileSystem.from_uri(uri)
+    if filesystem.get_file_info(path).type != pafs.FileType.File:
+        return None, 0
+
+    with filesystem.open_input_file(path) as source:
+        num_rows = pq.ParquetFile(source).metadata.num_rows
+
+    return _reference(uri, batched), num_rows
+
+
+def write_record_batches(
+    batches: Iterable[List[Dict]],
+    uri: str,
+    batched: bool = False,
+    schema: Optional[pa.Schema] = None,
+) -> Tuple[Optional[str], int]:
+    """
+    Stream record batches into a single Parquet file, one row group per batch.
+
+    Without an explicit ``schema`` it is inferred from the first non-empty
+    batch. Every batch is conformed to the file schema; a batch with columns
+    the schema lacks, or values that don't fit their column type (e.g. 118.5 in
+    an integer column, numbers in a column that was all null at first), raises
+    ValueError instead of being written incompletely. Only one batch is held in
+    memory at a time.
+
+    Args:
+        batches: Iterable of record lists
+        uri: Target URI, from ``cache_uri`` or ``ParquetXComBackend.build_uri``
+        batched: Return a batched reference instead of a resolved one
+        schema: File schema, for payloads whose columns or types can vary
+
+    Returns:
+        Tuple of (XCom reference to push, rows written). The reference is None
+        when no rows were written.
+    """
+    filesystem, path = pafs.FileSystem.from_uri(uri)
+    writer = None
+    rows_written = 0
+    try:
+        for batch in batches:
+            if not batch:
+                continue
+
+            if writer is None:
+                if schema is None:
+                    schema = _promote_null_fields(pa.Table.from_pylist(batch).schema)
+                filesystem.create_dir(os.path.dirname(path), recursive=True)
+                writer = pq.ParquetWriter(path, schema, filesystem=filesystem)
+
+            table = _conform_table(pa.Table.from_pylist(batch), writer.schema)
+            writer.write_table(table)
+            rows_written += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        return None, 0
+
+    return _reference(uri, batched), rows_written
+
+
+def iter_record_batches(value: Any) -> Iterator[List[Dict]]:
+    """
+    Iterate a pulled XCom value as record lists, one Parquet row group at a time.
+
+    Plain record lists are yielded as a single batch.
+    """
+    if _is_batch_reference(value):
+        filesystem, path = _open_batch_reference(value)
+        with filesystem.open_input_file(path) as source:
+            parquet_file = pq.ParquetFile(source)
+            for index in range(parquet_file.num_row_groups):
+                yield parquet_file.read_row_group(index).to_pylist()
+    elif value:
+        yield value
+
+
+def read_record_frame(value: Any) -> pd.DataFrame:
+    """Read a pulled XCom value (batched reference or record list) into a DataFrame."""
+    if _is_batch_reference(value):
+        filesystem, path = _open_batch_reference(value)
+        return pq.read_table(path, filesystem=filesystem).to_pandas()
+
+    return pd.DataFrame(value or [])
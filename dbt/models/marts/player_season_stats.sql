@@ -1,7 +1,10 @@
 {{
   config(
     materialized='table',
-    schema='analytics'
+    schema='analytics',
+    indexes=[
+      {'columns': ['player_key', 'season_id']}
+    ]
   )
 }}
 
@@ -11,6 +11,8 @@ import os
 import sys
 from pathlib import Path
 
+import pyarrow as pa
+
 os.environ["DATABASE_HOST"] = "localhost"
 os.environ["DATABASE_PORT"] = "5433"
 
@@ -20,13 +22,16 @@ sys.path.insert(0, str(project_root))
 # flake8: noqa: E402 (module level import not at top - intentional)
 from src.analytics.metrics import calculate_advanced_metrics
 from src.etl.extractors.nba_extractor import NBAExtractor
-from src.etl.loaders.postgres_loader import PostgresLoader
+from src.etl.loaders.postgres_loader import PLAYER_STATS_STAGING_SCHEMA, PostgresLoader
 from src.etl.transformers.nba_transformer import NBATransformer
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+_SCHEMA_COLUMNS = frozenset(PLAYER_STATS_STAGING_SCHEMA.names)
+
+
 def test_extraction(test_date="2024-12-15"):
     print("\n" + "=" * 80)
     print("STEP 1: EXTRACTION")
@@ -147,60 +152,12 @@ def test_schema_compatibility(enhanced_stats):
         print("ERROR: No enhanced stats to check")
         return False
 
-    import pandas as pd
-
     try:
-        test_record = [enhanced_stats[0]]
-        df = pd.DataFrame(test_record)
-
-        print(f"DataFrame has {len(df.columns)} columns")
-
-        schema_columns = [
-            "game_id",
-            "team_id",
-            "player_id",
-            "player_name",
-            "position",
-            "jersey_num",
-            "minutes_played",
-            "field_goals_made",
-            "field_goals_attempted",
-            "field_goal_pct",
-            "three_pointers_made",
-            "three_pointers_attempted",
-            "three_point_pct",
-            "free_throws_made",
-            "free_throws_attempted",
-            "free_throw_pct",
-            "offensive_rebounds",
-            "defensive_rebounds",
-            "total_rebounds",
-            "assists",
-            "steals",
-            "blocks",
-            "turnovers",
-            "personal_fouls",
-            "points",
-            "plus_minus",
-            "offensive_rating",
-            "defensive_rating",
-            "net_rating",
-            "true_shooting_pct",
-            "effective_fg_pct",
-            "usage_pct",
-            "pace",
-            "pie",
-            "assist_percentage",
-            "assist_to_turnover",
-            "assist_ratio",
-            "offensive_rebound_pct",
-            "defensive_rebound_pct",
-            "rebound_percentage",
-            "turnover_ratio",
-            "raw_data",
-        ]
-
-        extra_cols = [col for col in df.columns if col not in schema_columns]
+        test_record = enhanced_stats[0]
+
+        print(f"Record has {len(test_record)} columns")
+
+        extra_cols = [col for col in test_record if col not in _SCHEMA_COLUMNS]
 
         if extra_cols:
             print("\nERROR: Extra columns not in schema:")
@@ -209,6 +166,9 @@ def test_schema_compatibility(enhanced_stats):
             print("\nThese will cause database errors")
             return False
 
+        # Converting against the pinned schema fails on values of the wrong type
+        pa.Table.from_pylist([test_record], schema=PLAYER_STATS_STAGING_SCHEMA)
+
         print("All columns match schema")
 
         return True
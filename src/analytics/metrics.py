@@ -12,12 +12,51 @@ Calculates advanced basketball statistics including:
 Formulas based on Basketball-Reference.com methodology.
 """
 
-from typing import Dict, List
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, cpu_count, delayed
 
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Box score lines repeat a lot across a season, so the scalar shooting
+# formulas are memoized on their (hashable) integer inputs
+SHOOTING_CACHE_SIZE = 1 << 16
+
+# League average points per marginal win (simplified); Win Shares scale by its
+# precomputed reciprocals so the formulas multiply instead of divide
+MARGINAL_POINTS_PER_WIN = 30.0
+_OWS_PER_POINT = 1.0 / MARGINAL_POINTS_PER_WIN
+_DWS_PER_POINT = 0.7 / MARGINAL_POINTS_PER_WIN
+
+# Regulation game length, used to scale per-minute ratings to per-game
+MINUTES_PER_GAME = 48.0
+
+
+@lru_cache(maxsize=SHOOTING_CACHE_SIZE)
+def _true_shooting_pct(points: int, fga: int, fta: int) -> float:
+    """Cached TS% = PTS / (2 * (FGA + 0.44 * FTA)), rounded to 3 decimals."""
+    if fga + fta == 0:
+        return 0.0
+
+    ts_pct = points / (2 * (fga + 0.44 * fta))
+    return round(ts_pct, 3)
+
+
+@lru_cache(maxsize=SHOOTING_CACHE_SIZE)
+def _effective_fg_pct(fgm: int, fg3m: int, fga: int) -> float:
+    """Cached eFG% = (FGM + 0.5 * 3PM) / FGA, rounded to 3 decimals."""
+    if fga == 0:
+        return 0.0
+
+    efg_pct = (fgm + 0.5 * fg3m) / fga
+    return round(efg_pct, 3)
+
 
 class AdvancedMetricsCalculator:
     """
@@ -26,6 +65,9 @@ class AdvancedMetricsCalculator:
     All calculations follow Basketball-Reference.com formulas where applicable.
     """
 
+    # Stateless: all calculations are static, so instances carry no __dict__
+    __slots__ = ()
+
     # League average constants (updated annually)
     LEAGUE_PACE = 99.0  # Possessions per 48 minutes
     LEAGUE_PPG = 110.0  # Points per game
@@ -48,11 +90,7 @@ class AdvancedMetricsCalculator:
         Returns:
             True shooting percentage (0-1)
         """
-        if fga + fta == 0:
-            return 0.0
-
-        ts_pct = points / (2 * (fga + 0.44 * fta))
-        return round(ts_pct, 3)
+        return _true_shooting_pct(points, fga, fta)
 
     @staticmethod
     def calculate_effective_fg_pct(fgm: int, fg3m: int, fga: int) -> float:
@@ -69,11 +107,7 @@ class AdvancedMetricsCalculator:
         Returns:
             Effective FG percentage (0-1)
         """
-        if fga == 0:
-            return 0.0
-
-        efg_pct = (fgm + 0.5 * fg3m) / fga
-        return round(efg_pct, 3)
+        return _effective_fg_pct(fgm, fg3m, fga)
 
     @staticmethod
     def calculate_usage_rate(
@@ -164,15 +198,21 @@ class AdvancedMetricsCalculator:
             return 0.0
 
         # Simplified PER calculation (actual formula has many more factors)
-        factor = (2 / 3) - (0.5 * (league_pace / team_pace)) / (2 * (league_pace / team_pace))
+        # Hollinger's factor needs league AST/FG/FT totals; in this simplified
+        # form (2/3 - (0.5 * r) / (2 * r)) it reduces to the constant 2/3 - 1/4
+        factor = (2 / 3) - 0.25
         VOP = 1.0  # Value of possession (simplified)
         DRB_perc = 0.75  # Defensive rebound percentage (simplified)
 
+        # Shared sub-expressions, computed once
+        pace_ratio = team_pace / league_pace
+        ast_fgm_ratio = ast / (2 * fgm) if fgm else 0.0
+
         uPER = (1 / min_played) * (
             fg3m
             + (2 / 3) * ast
-            + (2 - factor * (team_pace / league_pace)) * fgm
-            + (ftm * 0.5 * (1 + (1 - (ast / (2 * fgm))) + (2 / 3) * (ast / (2 * fgm))))
+            + (2 - factor * pace_ratio) * fgm
+            + (ftm * 0.5 * (1 + (1 - ast_fgm_ratio) + (2 / 3) * ast_fgm_ratio))
             + VOP * oreb
             + VOP * dreb * (1 - DRB_perc)
             + VOP * stl
@@ -248,10 +288,9 @@ class AdvancedMetricsCalculator:
         # Simplified defensive rating
         team_drtg = 100 * (opp_points / opp_possessions) if opp_possessions > 0 else 100
 
-        # Defensive impact (simplified)
-        ((team_dreb + team_stl + team_blk) / team_min) * min_played
-        player_def = (dreb + stl + blk) / min_played if min_played > 0 else 0
-        team_def = (team_dreb + team_stl + team_blk) / team_min if team_min > 0 else 0
+        # Defensive impact (simplified); minutes are non-zero past the guard above
+        player_def = (dreb + stl + blk) / min_played
+        team_def = (team_dreb + team_stl + team_blk) / team_min
 
         # Adjust team DRTG based on player contribution
         if team_def > 0:
@@ -305,12 +344,11 @@ class AdvancedMetricsCalculator:
 
         # Offensive Win Shares (simplified)
         marginal_offense = points - 0.92 * (fga - fgm) - 0.44 * (fta - ftm)
-        marginal_points_per_win = 30.0  # League average (simplified)
-        ows = marginal_offense / marginal_points_per_win
+        ows = marginal_offense * _OWS_PER_POINT
 
         # Defensive Win Shares (simplified)
         defensive_contribution = dreb + stl + blk - (tov * 0.5)
-        dws = defensive_contribution / marginal_points_per_win * 0.7
+        dws = defensive_contribution * _DWS_PER_POINT
 
         # Total Win Shares
         ws = ows + dws
@@ -367,7 +405,7 @@ class AdvancedMetricsCalculator:
             - 0.176 * (fga - fgm)
             - 0.146 * (fta - (points - 2 * fgm))
             - 0.162 * tov  # FTM approximation
-        ) / (min_played / 48)
+        ) * (MINUTES_PER_GAME / min_played)
 
         # Adjust to league average of 0
         bpm = raw_bpm - 2.0
@@ -375,51 +413,277 @@ class AdvancedMetricsCalculator:
         return round(bpm, 1)
 
 
-def calculate_advanced_metrics(player_stats: List[Dict]) -> List[Dict]:
+# Box-score counts are small integers, exact in float32, so input columns are
+# stored at half width; the kernel does its arithmetic in float64
+COUNT_DTYPE = np.float32
+
+# Minimum rows per chunk before the kernel is split across threads (numpy
+# releases the GIL, so threads scale; below this the dispatch overhead wins)
+PARALLEL_THRESHOLD = 10_000
+
+# Inputs of the shooting efficiency kernel, in argument order (TRANSFORMED field names)
+_SHOOTING_FIELDS = (
+    "points",
+    "field_goals_made",
+    "field_goals_attempted",
+    "three_pointers_made",
+    "free_throws_attempted",
+)
+
+
+class PlayerStatRow(NamedTuple):
+    """
+    Typed per-game shooting line, an alternative to record dictionaries.
+
+    Fields are read by position instead of by key hashing, which makes column
+    extraction in ``calculate_advanced_metrics`` cheaper for large batches.
+    """
+
+    points: int = 0
+    field_goals_made: int = 0
+    field_goals_attempted: int = 0
+    three_pointers_made: int = 0
+    free_throws_attempted: int = 0
+    true_shooting_pct: Optional[float] = None
+    effective_fg_pct: Optional[float] = None
+
+
+def _numeric_column(df: pd.DataFrame, name: str) -> np.ndarray:
+    """Get a numeric column as a count array, treating missing values as 0."""
+    if name not in df.columns:
+        return np.zeros(len(df), dtype=COUNT_DTYPE)
+    return pd.to_numeric(df[name]).fillna(0).to_numpy(dtype=COUNT_DTYPE)
+
+
+def _record_column(records: List[Dict], name: str) -> np.ndarray:
+    """Get a numeric field of a record list as a count array, treating missing values as 0."""
+    try:
+        # Fast path: a C-level itemgetter lookup per record (None becomes NaN)
+        values = np.fromiter(map(itemgetter(name), records), dtype=COUNT_DTYPE, count=len(records))
+    except KeyError:
+        # Some records don't have the field at all
+        values = np.fromiter(
+            (record.get(name) or 0 for record in records), dtype=COUNT_DTYPE, count=len(records)
+        )
+    return np.nan_to_num(values, copy=False)
+
+
+def _row_column(rows: List[PlayerStatRow], name: str) -> np.ndarray:
+    """Get a count field of a PlayerStatRow list as a count array."""
+    return np.fromiter(map(attrgetter(name), rows), dtype=COUNT_DTYPE, count=len(rows))
+
+
+def _provided_values(values: Iterable[Optional[float]], count: int) -> np.ndarray:
+    """Collect metric values into a float array, with NaN where they are missing."""
+    return np.fromiter(
+        (np.nan if value is None else value for value in values),
+        dtype=np.float64,
+        count=count,
+    )
+
+
+def _provided_metric(records: List[Dict], name: str) -> np.ndarray:
+    """Get a metric field of a record list as a float array, with NaN where it is missing."""
+    return _provided_values((record.get(name) for record in records), len(records))
+
+
+def _row_metric(rows: List[PlayerStatRow], name: str) -> np.ndarray:
+    """Get a metric field of a PlayerStatRow list as a float array, with NaN where it is missing."""
+    return _provided_values(map(attrgetter(name), rows), len(rows))
+
+
+def _keep_provided(provided: np.ndarray, calculated: np.ndarray) -> np.ndarray:
+    """Take the calculated value wherever the provided one is missing (API didn't provide it)."""
+    return np.where(np.isnan(provided), calculated, provided)
+
+
+def _all_provided(*provided: np.ndarray) -> bool:
+    """Check whether no metric value is missing, so there is nothing to calculate."""
+    return not any(np.isnan(values).any() for values in provided)
+
+
+def _fill_missing(df: pd.DataFrame, name: str, values: np.ndarray) -> None:
+    """Fill a metric column with calculated values where it is null."""
+    if name not in df.columns:
+        df[name] = values
+    else:
+        provided = df[name].to_numpy(dtype=np.float64, na_value=np.nan)
+        df[name] = _keep_provided(provided, values)
+
+
+def _shooting_efficiency(
+    points: np.ndarray,
+    fgm: np.ndarray,
+    fga: np.ndarray,
+    fg3m: np.ndarray,
+    fta: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Array kernel for TS% and eFG%, rounded to 3 decimals.
+
+    Works on plain float arrays only, so the whole batch is computed in numpy's
+    compiled loops without any per-row Python work. Inputs are not modified and
+    may be narrower than float64 (``COUNT_DTYPE``); results are always float64
+    so rounding matches the scalar ``AdvancedMetricsCalculator`` formulas.
+
+    Returns:
+        Tuple of (true shooting %, effective FG %) arrays
+    """
+    # Intermediates are built in place, so each metric allocates one scratch
+    # array plus its output instead of a new array per operator
+
+    # TS% = PTS / (2 * (FGA + 0.44 * FTA)), 0 when no attempts
+    tsa = np.multiply(fta, 0.44, dtype=np.float64)
+    tsa += fga
+    tsa *= 2
+    ts_pct = np.divide(points, tsa, out=np.zeros_like(tsa), where=tsa > 0)
+    np.round(ts_pct, 3, out=ts_pct)
+
+    # eFG% = (FGM + 0.5 * 3PM) / FGA, 0 when no attempts
+    efg_made = np.multiply(fg3m, 0.5, dtype=np.float64)
+    efg_made += fgm
+    efg_pct = np.divide(efg_made, fga, out=np.zeros_like(efg_made), where=fga > 0)
+    np.round(efg_pct, 3, out=efg_pct)
+
+    return ts_pct, efg_pct
+
+
+def _compute_shooting_efficiency(columns: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run the shooting efficiency kernel over a batch of input columns.
+
+    Large batches (season-scale backfills) are split into contiguous chunks of
+    at least ``PARALLEL_THRESHOLD`` rows and computed on a thread pool.
+
+    Args:
+        columns: Kernel input arrays, in ``_SHOOTING_FIELDS`` order
+
+    Returns:
+        Tuple of (true shooting %, effective FG %) arrays
+    """
+    n_jobs = min(cpu_count(), len(columns[0]) // PARALLEL_THRESHOLD)
+    if n_jobs < 2:
+        return _shooting_efficiency(*columns)
+
+    chunks = zip(*(np.array_split(column, n_jobs) for column in columns))
+    results = Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(_shooting_efficiency)(*chunk) for chunk in chunks
+    )
+    ts_chunks, efg_chunks = zip(*results)
+
+    return np.concatenate(ts_chunks), np.concatenate(efg_chunks)
+
+
+def _calculate_advanced_metrics_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Vectorized advanced metrics calculation over a DataFrame of player game stats.
+
+    Args:
+        df: DataFrame of TRANSFORMED player statistics
+
+    Returns:
+        The same DataFrame with advanced metric columns filled in
+    """
+    logger.info(f"Calculating advanced metrics for {len(df)} player records")
+
+    metric_columns = ["true_shooting_pct", "effective_fg_pct"]
+    if set(metric_columns).issubset(df.columns) and df[metric_columns].notna().all(axis=None):
+        logger.info("Advanced metrics already provided for all records")
+        return df
+
+    ts_pct, efg_pct = _compute_shooting_efficiency(
+        [_numeric_column(df, field) for field in _SHOOTING_FIELDS]
+    )
+
+    # Only override if not already calculated by API
+    _fill_missing(df, "true_shooting_pct", ts_pct)
+    _fill_missing(df, "effective_fg_pct", efg_pct)
+
+    logger.info("Advanced metrics calculation complete")
+    return df
+
+
+def _calculate_advanced_metrics_rows(rows: List[PlayerStatRow]) -> List[PlayerStatRow]:
+    """
+    Advanced metrics calculation over a list of PlayerStatRow tuples.
+
+    Args:
+        rows: Player shooting lines
+
+    Returns:
+        New list of rows with missing metrics filled in (tuples are immutable)
+    """
+    provided_ts = _row_metric(rows, "true_shooting_pct")
+    provided_efg = _row_metric(rows, "effective_fg_pct")
+    if _all_provided(provided_ts, provided_efg):
+        return list(rows)
+
+    ts_pct, efg_pct = _compute_shooting_efficiency(
+        [_row_column(rows, field) for field in _SHOOTING_FIELDS]
+    )
+
+    # Only override if not already calculated by API
+    ts_pct = _keep_provided(provided_ts, ts_pct)
+    efg_pct = _keep_provided(provided_efg, efg_pct)
+
+    return [
+        row._replace(true_shooting_pct=ts, effective_fg_pct=efg)
+        for row, ts, efg in zip(rows, ts_pct.tolist(), efg_pct.tolist())
+    ]
+
+
+def calculate_advanced_metrics(
+    player_stats: Union[List[Dict], List[PlayerStatRow], pd.DataFrame],
+) -> Union[List[Dict], List[PlayerStatRow], pd.DataFrame]:
     """
     Calculate all advanced metrics for a list of player game stats.
 
+    All inputs are computed with vectorized array operations. Record lists are
+    updated in place; DataFrames avoid the per-record write-back and are the
+    preferred path for large batches (e.g. historical backfills). Lists of
+    ``PlayerStatRow`` skip key lookups and come back as a new list.
+
     Args:
-        player_stats: List of TRANSFORMED player statistics dictionaries
+        player_stats: List of TRANSFORMED player statistics dictionaries,
+                      a list of PlayerStatRow, or a DataFrame with the same columns
 
     Returns:
-        Enhanced list with advanced metrics added
+        Enhanced list (or DataFrame) with advanced metrics added
     """
+    if isinstance(player_stats, pd.DataFrame):
+        return _calculate_advanced_metrics_frame(player_stats)
+
     logger.info(f"Calculating advanced metrics for {len(player_stats)} player records")
 
-    calculator = AdvancedMetricsCalculator()
-    enhanced_stats = []
-
-    for stats in player_stats:
-        # Extract base stats - USE TRANSFORMED FIELD NAMES
-        points = stats.get("points", 0)
-        fgm = stats.get("field_goals_made", 0)
-        fga = stats.get("field_goals_attempted", 0)
-        fg3m = stats.get("three_pointers_made", 0)
-        stats.get("free_throws_made", 0)
-        fta = stats.get("free_throws_attempted", 0)
-        stats.get("offensive_rebounds", 0)
-        stats.get("defensive_rebounds", 0)
-        stats.get("total_rebounds", 0)
-        stats.get("assists", 0)
-        stats.get("steals", 0)
-        stats.get("blocks", 0)
-        stats.get("turnovers", 0)
-        stats.get("personal_fouls", 0)
-        stats.get("minutes_played", 0)
-
-        # Calculate advanced metrics - USE SCHEMA FIELD NAMES
-        # Only override if not already calculated by API
-        if stats.get("true_shooting_pct") is None:
-            stats["true_shooting_pct"] = calculator.calculate_true_shooting_pct(points, fga, fta)
-
-        if stats.get("effective_fg_pct") is None:
-            stats["effective_fg_pct"] = calculator.calculate_effective_fg_pct(fgm, fg3m, fga)
-
-        # Note: PER, Usage, WS require team-level data
-        # These would be calculated in a separate aggregation step
-
-        enhanced_stats.append(stats)
+    if not player_stats:
+        return []
+
+    if isinstance(player_stats[0], PlayerStatRow):
+        return _calculate_advanced_metrics_rows(player_stats)
+
+    provided_ts = _provided_metric(player_stats, "true_shooting_pct")
+    provided_efg = _provided_metric(player_stats, "effective_fg_pct")
+    if _all_provided(provided_ts, provided_efg):
+        logger.info("Advanced metrics already provided for all records")
+        return player_stats
+
+    # Extract the input columns once, then compute every row in one array pass
+    ts_pct, efg_pct = _compute_shooting_efficiency(
+        [_record_column(player_stats, field) for field in _SHOOTING_FIELDS]
+    )
+
+    # Calculate advanced metrics - USE SCHEMA FIELD NAMES
+    # Only override if not already calculated by API: the choice is made with
+    # one array mask per metric, so the write-back loop has no branches
+    ts_pct = _keep_provided(provided_ts, ts_pct)
+    efg_pct = _keep_provided(provided_efg, efg_pct)
+
+    for stats, ts, efg in zip(player_stats, ts_pct.tolist(), efg_pct.tolist()):
+        stats["true_shooting_pct"] = ts
+        stats["effective_fg_pct"] = efg
+
+    # Note: PER, Usage, WS require team-level data
+    # These would be calculated in a separate aggregation step
 
     logger.info("Advanced metrics calculation complete")
-    return enhanced_stats
+    return player_stats
@@ -5,11 +5,16 @@ Handles extraction of NBA data from the official NBA API using nba_api library.
 Implements retry logic, rate limiting, and error handling.
 """
 
+import threading
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
+import requests
+import requests_cache
 from nba_api.stats.endpoints import (
     boxscoreadvancedv3,
     boxscoretraditionalv3,
@@ -19,13 +24,85 @@ from nba_api.stats.endpoints import (
     playercareerstats,
     playergamelog,
 )
+from nba_api.stats.library.http import NBAStatsHTTP
 from nba_api.stats.static import players, teams
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.utils.config import Config
 from src.utils.logger import get_logger
+from src.utils.rate_limiter import TokenBucketLimiter
 
 logger = get_logger(__name__)
 
+# Connection pool size for the shared HTTP session (covers the threaded per-game
+# fan-out, with both box scores of a game in flight at once)
+HTTP_POOL_SIZE = 16
+
+# Response cache lifetimes per stats.nba.com endpoint; anything not listed
+# (game finders, game logs) always goes to the network. Box scores are left
+# out: the response doesn't say whether the game is final, and a cached
+# partial box score would be served to the retries of unfinished games
+HTTP_CACHE_EXPIRE_AFTER = {
+    "stats.nba.com/stats/playercareerstats*": timedelta(days=1),
+    "stats.nba.com/stats/commonteamroster*": timedelta(hours=6),
+    "stats.nba.com/stats/leaguestandings*": timedelta(hours=6),
+    "*": requests_cache.DO_NOT_CACHE,
+}
+
+# Sent by nba_api on every request; requests-cache never reads the cache for them
+NO_CACHE_REQUEST_HEADERS = ("Cache-Control", "Pragma")
+
+# Responses that mean the API gateway wants us to slow down
+RATE_LIMIT_STATUSES = (429, 503)
+# Pause applied when such a response carries no usable Retry-After (seconds)
+RATE_LIMIT_BACKOFF = 5.0
+# Remaining share of the advertised quota below which requests are paused
+LOW_QUOTA_FRACTION = 0.1
+
+
+# Season strings by starting year, over the whole history of the league
+SEASON_BY_START_YEAR = {year: f"{year}-{str(year + 1)[-2:]}" for year in range(1946, 2100)}
+
+# NBA seasons start in October: earlier months belong to the previous year's season
+SEASON_START_MONTH = 10
+
+
+def _header_number(headers, name: str) -> Optional[float]:
+    """Read a numeric response header, None if missing or not a number."""
+    try:
+        return float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class _NBACachedSession(requests_cache.CachedSession):
+    """CachedSession that ignores nba_api's no-cache request headers."""
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        for header in NO_CACHE_REQUEST_HEADERS:
+            request.headers.pop(header, None)
+        return super().send(request, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def _static_teams() -> Tuple[Dict, ...]:
+    """Cached team list from nba_api's bundled static data (constant for the process)."""
+    return tuple(teams.get_teams())
+
+
+@lru_cache(maxsize=64)
+def _season_date_range(season: str) -> Tuple[str, str]:
+    """Cached (start_date, end_date) of a season string such as '2024-25'."""
+    # Parse season string
+    start_year = int(season.split("-")[0])
+
+    # NBA regular season typically runs October to April
+    season_start = f"{start_year}-10-01"
+    season_end = f"{start_year + 1}-06-30"
+
+    return season_start, season_end
+
 
 class NBAExtractor:
     """
@@ -33,43 +110,128 @@ class NBAExtractor:
 
     Features:
     - Automatic retry with exponential backoff
-    - Rate limiting (600 requests per minute)
+    - Shared keep-alive HTTP session for all API requests, with a persistent
+      response cache for slowly changing endpoints
+    - Rate limiting (600 requests per minute, evenly spaced and shared by all
+      threads and instances), paused when the API signals throttling
     - Data validation
     - Caching support
     """
 
+    _http_session: Optional[requests.Session] = None
+    _http_session_lock = threading.Lock()
+    _limiter: Optional[TokenBucketLimiter] = None
+    _limiter_lock = threading.Lock()
+
     def __init__(self, rate_limit: int = 600):
         """
         Initialize the NBA extractor.
 
         Args:
-            rate_limit: Maximum requests per minute (default: 600)
+            rate_limit: Maximum requests per minute for the whole process
+                (default: 600); the lowest rate any extractor asked for applies
         """
         self.rate_limit = rate_limit
-        self.request_count = 0
-        self.last_reset = time.time()
+        self._get_limiter(rate_limit)
         self.config = Config()
+        NBAStatsHTTP.set_session(self._get_http_session())
         logger.info("NBA Extractor initialized")
 
-    def _rate_limit_check(self):
-        """Check and enforce rate limiting"""
-        current_time = time.time()
+    @classmethod
+    def _get_http_session(cls) -> requests.Session:
+        """
+        Get the process-wide HTTP session used by nba_api endpoints.
+
+        Reusing one pooled session keeps connections to stats.nba.com alive
+        across requests and extractor instances instead of paying a new
+        TCP/TLS handshake per call. Successful responses of the endpoints in
+        ``HTTP_CACHE_EXPIRE_AFTER`` are cached in SQLite (``NBA_API_CACHE_PATH``)
+        and shared across runs, so repeated queries skip the network.
+        """
+        with cls._http_session_lock:
+            if cls._http_session is None:
+                if Config.NBA_API_CACHE_PATH:
+                    session = _NBACachedSession(
+                        Config.NBA_API_CACHE_PATH,
+                        backend="sqlite",
+                        wal=True,
+                        allowable_methods=("GET",),
+                        urls_expire_after=HTTP_CACHE_EXPIRE_AFTER,
+                    )
+                else:
+                    session = requests.Session()
+                # Transport-level reconnects only; request retries are handled by _retry_request
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_POOL_SIZE,
+                    pool_maxsize=HTTP_POOL_SIZE,
+                    max_retries=Retry(connect=3, read=0, backoff_factor=0.5),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({"Accept-Encoding": "gzip, deflate"})
+                session.hooks["response"].append(cls._throttle_on_response)
+                cls._http_session = session
+
+            return cls._http_session
+
+    @classmethod
+    def _get_limiter(cls, rate_limit: int) -> TokenBucketLimiter:
+        """
+        Get the process-wide rate limiter shared by all extractor instances.
+
+        All instances talk to the same API through the same session, so they
+        draw from one request budget instead of one each. A lower
+        ``rate_limit`` than the current one tightens that budget for everyone;
+        a higher one is ignored.
+        """
+        with cls._limiter_lock:
+            if cls._limiter is None:
+                cls._limiter = TokenBucketLimiter(rate=rate_limit, per=60)
+            elif cls._limiter.limit_to(rate_limit):
+                logger.warning(
+                    "Shared NBA API rate limit lowered to %s requests per minute", rate_limit
+                )
+
+            return cls._limiter
+
+    @classmethod
+    def clear_session(cls):
+        """
+        Replace the shared HTTP session with a fresh one.
+
+        Used when requests keep timing out on pooled connections that the API
+        gateway has silently dropped. The old session is not closed, so
+        requests still in flight on other threads can finish.
+        """
+        with cls._http_session_lock:
+            cls._http_session = None
+
+        NBAStatsHTTP.set_session(cls._get_http_session())
+        logger.warning("NBA API HTTP session reset")
 
-        # Reset counter every minute
-        if current_time - self.last_reset >= 60:
-            self.request_count = 0
-            self.last_reset = current_time
+    @classmethod
+    def _throttle_on_response(cls, response: requests.Response, *args, **kwargs):
+        """
+        Session response hook pausing every extractor when the API pushes back.
+
+        Triggers on 429/503 responses or when ``x-ratelimit-remaining`` drops
+        below ``LOW_QUOTA_FRACTION`` of ``x-ratelimit-limit``, and holds requests
+        for the advertised ``Retry-After`` (or ``RATE_LIMIT_BACKOFF``).
+        """
+        remaining = _header_number(response.headers, "x-ratelimit-remaining")
+        limit = _header_number(response.headers, "x-ratelimit-limit")
+        low_quota = remaining is not None and limit and remaining < limit * LOW_QUOTA_FRACTION
 
-        # Wait if we've hit the rate limit
-        if self.request_count >= self.rate_limit:
-            sleep_time = 60 - (current_time - self.last_reset)
-            if sleep_time > 0:
-                logger.warning(f"Rate limit reached. Sleeping for {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
-                self.request_count = 0
-                self.last_reset = time.time()
+        if response.status_code not in RATE_LIMIT_STATUSES and not low_quota:
+            return
 
-        self.request_count += 1
+        retry_after = _header_number(response.headers, "Retry-After")
+        if cls._limiter is not None:
+            cls._limiter.defer(retry_after if retry_after is not None else RATE_LIMIT_BACKOFF)
+
+    def _rate_limit_check(self):
+        """Wait for the next request slot (thread-safe)"""
+        self._limiter.acquire()
 
     def _retry_request(self, func, max_retries: int = 3, **kwargs) -> Any:
         """
@@ -91,25 +253,33 @@ class NBAExtractor:
             except Exception as e:
                 wait_time = 2**attempt  # Exponential backoff
                 logger.warning(
-                    f"Attempt {attempt + 1}/{max_retries} failed: {str(e)}. "
-                    f"Retrying in {wait_time}s..."
+                    "Attempt %s/%s failed: %s. Retrying in %ss...",
+                    attempt + 1,
+                    max_retries,
+                    e,
+                    wait_time,
                 )
                 if attempt < max_retries - 1:
+                    # Repeated network failures point at stale pooled connections
+                    if attempt > 0 and isinstance(e, (requests.Timeout, requests.ConnectionError)):
+                        self.clear_session()
                     time.sleep(wait_time)
                 else:
-                    logger.error(f"All retry attempts failed for {func.__name__}")
+                    logger.error("All retry attempts failed for %s", func.__name__)
                     raise
 
     def get_all_teams(self) -> List[Dict]:
         """
         Get all NBA teams (active and historical).
 
+        The team dictionaries are shared between calls and should not be modified.
+
         Returns:
             List of team dictionaries with metadata
         """
         logger.info("Fetching all NBA teams")
-        all_teams = teams.get_teams()
-        logger.info(f"Retrieved {len(all_teams)} teams")
+        all_teams = list(_static_teams())
+        logger.info("Retrieved %s teams", len(all_teams))
         return all_teams
 
     def get_all_players(self, is_only_current_season: bool = False) -> List[Dict]:
@@ -122,38 +292,36 @@ class NBAExtractor:
         Returns:
             List of player dictionaries with metadata
         """
-        logger.info(f"Fetching {'current season' if is_only_current_season else 'all'} players")
+        logger.info("Fetching %s players", "current season" if is_only_current_season else "all")
         all_players = players.get_players()
 
         if is_only_current_season:
             all_players = [p for p in all_players if p.get("is_active", False)]
 
-        logger.info(f"Retrieved {len(all_players)} players")
+        logger.info("Retrieved %s players", len(all_players))
         return all_players
 
-    def get_games_by_date(self, date: str, season: Optional[str] = None) -> List[Dict]:
+    def get_games_by_date(
+        self, date: str, season: Optional[str] = None, as_frame: bool = False
+    ) -> Union[List[Dict], pd.DataFrame]:
         """
         Get all games played on a specific date.
 
         Args:
             date: Date in YYYY-MM-DD format
             season: Season string (e.g., '2024-25'), if None uses current season
+            as_frame: Return the API DataFrame as is instead of a list of dictionaries
 
         Returns:
-            List of game dictionaries
+            List of game dictionaries (DataFrame if as_frame)
         """
-        logger.info(f"Fetching games for date: {date}")
+        logger.info("Fetching games for date: %s", date)
 
         if season is None:
-            # Infer season from date
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
-            year = date_obj.year
-            month = date_obj.month
-            # NBA season spans two years, Oct-Sep
-            if month >= 10:
-                season = f"{year}-{str(year + 1)[-2:]}"
-            else:
-                season = f"{year - 1}-{str(year)[-2:]}"
+            # Infer season from date; NBA season spans two years, Oct-Sep
+            date_obj = datetime.fromisoformat(date)
+            start_year = date_obj.year - (date_obj.month < SEASON_START_MONTH)
+            season = SEASON_BY_START_YEAR[start_year]
 
         game_finder = self._retry_request(
             leaguegamefinder.LeagueGameFinder,
@@ -164,10 +332,12 @@ class NBAExtractor:
         )
 
         games_df = game_finder.get_data_frames()[0]
-        games = games_df.to_dict("records")
+        logger.info("Retrieved %s game records for %s", len(games_df), date)
 
-        logger.info(f"Retrieved {len(games)} game records for {date}")
-        return games
+        if as_frame:
+            return games_df
+
+        return games_df.to_dict("records")
 
     def get_player_game_stats(self, game_id: str) -> List[Dict]:
         """
@@ -179,25 +349,41 @@ class NBAExtractor:
         Returns:
             List of player stat dictionaries
         """
-        logger.info(f"Fetching player stats for game: {game_id}")
+        logger.info("Fetching player stats for game: %s", game_id)
 
-        # Get traditional box score
-        traditional = self._retry_request(
-            boxscoretraditionalv3.BoxScoreTraditionalV3, game_id=game_id
-        )
+        # Both box scores are independent requests, so the advanced one is
+        # fetched on a helper thread while the traditional one runs here
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            advanced_future = executor.submit(
+                self._retry_request, boxscoreadvancedv3.BoxScoreAdvancedV3, game_id=game_id
+            )
 
-        # Get advanced box score
-        advanced = self._retry_request(boxscoreadvancedv3.BoxScoreAdvancedV3, game_id=game_id)
+            # Get traditional box score
+            traditional = self._retry_request(
+                boxscoretraditionalv3.BoxScoreTraditionalV3, game_id=game_id
+            )
+
+            # Get advanced box score
+            advanced = advanced_future.result()
 
         # Merge traditional and advanced stats
         trad_df = traditional.get_data_frames()[0]
         adv_df = advanced.get_data_frames()[0]
 
-        # Merge on player_id
-        merged_df = pd.merge(trad_df, adv_df, on=["teamId", "personId"], suffixes=("", "_adv"))
+        # Join 1:1 on the player keys; columns both box scores carry (game and
+        # player details) are taken from the traditional one only
+        keys = ["teamId", "personId"]
+        adv_only = adv_df.drop(
+            columns=adv_df.columns.intersection(trad_df.columns).difference(keys)
+        )
+        merged_df = (
+            trad_df.set_index(keys)
+            .join(adv_only.set_index(keys), how="inner", validate="1:1")
+            .reset_index()
+        )
 
         stats = merged_df.to_dict("records")
-        logger.info(f"Retrieved stats for {len(stats)} players in game {game_id}")
+        logger.info("Retrieved stats for %s players in game %s", len(stats), game_id)
 
         return stats
 
@@ -212,7 +398,7 @@ class NBAExtractor:
         Returns:
             List of game log dictionaries
         """
-        logger.info(f"Fetching season stats for player {player_id}, season {season}")
+        logger.info("Fetching season stats for player %s, season %s", player_id, season)
 
         game_log = self._retry_request(
             playergamelog.PlayerGameLog, player_id=player_id, season=season
@@ -221,7 +407,7 @@ class NBAExtractor:
         games_df = game_log.get_data_frames()[0]
         games = games_df.to_dict("records")
 
-        logger.info(f"Retrieved {len(games)} games for player {player_id}")
+        logger.info("Retrieved %s games for player %s", len(games), player_id)
         return games
 
     def get_player_career_stats(self, player_id: int) -> Dict:
@@ -234,7 +420,7 @@ class NBAExtractor:
         Returns:
             Dictionary containing career stats
         """
-        logger.info(f"Fetching career stats for player {player_id}")
+        logger.info("Fetching career stats for player %s", player_id)
 
         career = self._retry_request(playercareerstats.PlayerCareerStats, player_id=player_id)
 
@@ -244,11 +430,12 @@ class NBAExtractor:
 
         result = {
             "player_id": player_id,
-            "career_totals": career_totals.to_dict("records")[0] if not career_totals.empty else {},
+            # Only the first row is converted (one dict, not one per row)
+            "career_totals": career_totals.iloc[0].to_dict() if not career_totals.empty else {},
             "season_stats": season_totals.to_dict("records"),
         }
 
-        logger.info(f"Retrieved career stats for player {player_id}")
+        logger.info("Retrieved career stats for player %s", player_id)
         return result
 
     def get_team_roster(self, team_id: int, season: str = "2024-25") -> List[Dict]:
@@ -262,7 +449,7 @@ class NBAExtractor:
         Returns:
             List of player dictionaries on the roster
         """
-        logger.info(f"Fetching roster for team {team_id}, season {season}")
+        logger.info("Fetching roster for team %s, season %s", team_id, season)
 
         roster = self._retry_request(
             commonteamroster.CommonTeamRoster, team_id=team_id, season=season
@@ -271,7 +458,7 @@ class NBAExtractor:
         roster_df = roster.get_data_frames()[0]
         players = roster_df.to_dict("records")
 
-        logger.info(f"Retrieved {len(players)} players on roster")
+        logger.info("Retrieved %s players on roster", len(players))
         return players
 
     def get_league_standings(self, season: str = "2024-25") -> Dict:
@@ -284,7 +471,7 @@ class NBAExtractor:
         Returns:
             Dictionary with East and West conference standings
         """
-        logger.info(f"Fetching league standings for season {season}")
+        logger.info("Fetching league standings for season %s", season)
 
         standings = self._retry_request(
             leaguestandingsv3.LeagueStandingsV3, season=season, league_id="00"
@@ -292,9 +479,13 @@ class NBAExtractor:
 
         standings_df = standings.get_data_frames()[0]
 
-        # Separate by conference
-        east = standings_df[standings_df["Conference"] == "East"].to_dict("records")
-        west = standings_df[standings_df["Conference"] == "West"].to_dict("records")
+        # Separate by conference in a single grouping pass
+        conferences = {
+            name: group.to_dict("records")
+            for name, group in standings_df.groupby("Conference", sort=False)
+        }
+        east = conferences.get("East", [])
+        west = conferences.get("West", [])
 
         result = {
             "season": season,
@@ -302,7 +493,7 @@ class NBAExtractor:
             "western_conference": west,
         }
 
-        logger.info(f"Retrieved standings: {len(east)} East, {len(west)} West teams")
+        logger.info("Retrieved standings: %s East, %s West teams", len(east), len(west))
         return result
 
     def get_season_date_range(self, season: str) -> tuple:
@@ -315,14 +506,7 @@ class NBAExtractor:
         Returns:
             Tuple of (start_date, end_date) as strings
         """
-        # Parse season string
-        start_year = int(season.split("-")[0])
-
-        # NBA regular season typically runs October to April
-        season_start = f"{start_year}-10-01"
-        season_end = f"{start_year + 1}-06-30"
-
-        return season_start, season_end
+        return _season_date_range(season)
 
     def extract_historical_data(
         self, start_season: str, end_season: str, batch_size: int = 10
@@ -338,7 +522,7 @@ class NBAExtractor:
         Returns:
             Dictionary with extraction summary
         """
-        logger.info(f"Starting historical data extraction: {start_season} to {end_season}")
+        logger.info("Starting historical data extraction: %s to %s", start_season, end_season)
 
         # This is a placeholder - full implementation would be quite extensive
         # and would need to handle the large volume of data carefully
@@ -354,7 +538,9 @@ class NBAExtractor:
         # 1. Iterate through each season
         # 2. Extract games in batches
         # 3. Extract player stats for each game
-        # 4. Store in database incrementally
+        # 4. Collect each season's transformed records as DataFrames and
+        #    pd.concat them once per season before a single staging COPY
+        #    (PostgresLoader staging loads accept DataFrames directly)
         # 5. Handle errors and resume capability
 
         logger.info("Historical extraction complete")
@@ -5,21 +5,74 @@ Loads transformed data into PostgreSQL database.
 """
 
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Union
 
 import pandas as pd
+import pyarrow as pa
 
 from src.utils.database import DatabaseConnection
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Record lists shorter than this are inserted directly, skipping pandas and COPY
+SMALL_BATCH_ROWS = 16
+
+# Column types of staging.player_game_stats_raw (see scripts/setup_db.sql)
+PLAYER_STATS_STAGING_SCHEMA = pa.schema(
+    [
+        ("game_id", pa.string()),
+        ("team_id", pa.int32()),
+        ("player_id", pa.int32()),
+        ("player_name", pa.string()),
+        ("position", pa.string()),
+        ("jersey_num", pa.string()),
+        ("minutes_played", pa.float64()),
+        ("field_goals_made", pa.int32()),
+        ("field_goals_attempted", pa.int32()),
+        ("field_goal_pct", pa.float64()),
+        ("three_pointers_made", pa.int32()),
+        ("three_pointers_attempted", pa.int32()),
+        ("three_point_pct", pa.float64()),
+        ("free_throws_made", pa.int32()),
+        ("free_throws_attempted", pa.int32()),
+        ("free_throw_pct", pa.float64()),
+        ("offensive_rebounds", pa.int32()),
+        ("defensive_rebounds", pa.int32()),
+        ("total_rebounds", pa.int32()),
+        ("assists", pa.int32()),
+        ("steals", pa.int32()),
+        ("blocks", pa.int32()),
+        ("turnovers", pa.int32()),
+        ("personal_fouls", pa.int32()),
+        ("points", pa.int32()),
+        ("plus_minus", pa.int32()),
+        ("offensive_rating", pa.float64()),
+        ("defensive_rating", pa.float64()),
+        ("net_rating", pa.float64()),
+        ("true_shooting_pct", pa.float64()),
+        ("effective_fg_pct", pa.float64()),
+        ("usage_pct", pa.float64()),
+        ("pace", pa.float64()),
+        ("pie", pa.float64()),
+        ("assist_percentage", pa.float64()),
+        ("assist_to_turnover", pa.float64()),
+        ("assist_ratio", pa.float64()),
+        ("offensive_rebound_pct", pa.float64()),
+        ("defensive_rebound_pct", pa.float64()),
+        ("rebound_percentage", pa.float64()),
+        ("turnover_ratio", pa.float64()),
+        ("raw_data", pa.string()),
+    ]
+)
+
 
 class PostgresLoader:
     """
     Loads data into PostgreSQL database.
 
     Features:
+    - Bulk COPY loads for staging tables
     - Batch inserts
     - Error handling
     - Transaction management
@@ -29,32 +82,64 @@ class PostgresLoader:
         self.db = DatabaseConnection()
         logger.info("PostgreSQL Loader initialized")
 
-    def load_games_staging(self, games: List[Dict]) -> int:
+    @staticmethod
+    def _prepare_df(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Downcast integer columns to the smallest type that holds their values.
+
+        Only for COPY into the existing staging tables: box score counts fit in
+        int8/int16, so the frame held during the load takes a fraction of the
+        int64 default. Not used for dwh loads, where ``insert_dataframe`` may
+        create the table from the frame's dtypes. Float columns are kept as
+        float64: they are written as text and must round-trip exactly into
+        NUMERIC columns.
+        """
+        int_columns = df.select_dtypes(include="integer").columns
+        if len(int_columns):
+            df[int_columns] = df[int_columns].apply(pd.to_numeric, downcast="integer")
+        return df
+
+    def _load_staging(self, data: Union[List[Dict], pd.DataFrame], table_name: str) -> int:
+        """Load records or a DataFrame into a staging table, stamped with the load time."""
+        load_timestamp = datetime.now()
+
+        if isinstance(data, list) and len(data) < SMALL_BATCH_ROWS:
+            records = [{**record, "load_timestamp": load_timestamp} for record in data]
+            return self.db.insert_records(
+                records=records,
+                table_name=table_name,
+                schema="staging",
+                synchronous_commit=False,
+            )
+
+        df = self._prepare_df(data.copy() if isinstance(data, pd.DataFrame) else pd.DataFrame(data))
+        df["load_timestamp"] = load_timestamp
+
+        return self.db.copy_dataframe(
+            df=df,
+            table_name=table_name,
+            schema="staging",
+            synchronous_commit=False,
+        )
+
+    def load_games_staging(self, games: Union[List[Dict], pd.DataFrame]) -> int:
         """
         Load games into staging table.
 
         Args:
-            games: List of game dictionaries
+            games: List of game dictionaries, or a DataFrame with the same columns
 
         Returns:
             Number of rows loaded
         """
-        if not games:
+        if len(games) == 0:
             logger.warning("No games to load")
             return 0
 
         logger.info(f"Loading {len(games)} games to staging")
 
         try:
-            df = pd.DataFrame(games)
-            df["load_timestamp"] = datetime.now()
-
-            rows_loaded = self.db.insert_dataframe(
-                df=df,
-                table_name="team_game_stats_raw",
-                schema="staging",
-                if_exists="append",
-            )
+            rows_loaded = self._load_staging(games, "team_game_stats_raw")
 
             logger.info(f"Successfully loaded {rows_loaded} games")
             return rows_loaded
@@ -63,32 +148,24 @@ class PostgresLoader:
             logger.error(f"Failed to load games: {str(e)}")
             raise
 
-    def load_player_stats_staging(self, stats: List[Dict]) -> int:
+    def load_player_stats_staging(self, stats: Union[List[Dict], pd.DataFrame]) -> int:
         """
         Load player statistics into staging table.
 
         Args:
-            stats: List of player stat dictionaries
+            stats: List of player stat dictionaries, or a DataFrame with the same columns
 
         Returns:
             Number of rows loaded
         """
-        if not stats:
+        if len(stats) == 0:
             logger.warning("No player stats to load")
             return 0
 
         logger.info(f"Loading {len(stats)} player stats to staging")
 
         try:
-            df = pd.DataFrame(stats)
-            df["load_timestamp"] = datetime.now()
-
-            rows_loaded = self.db.insert_dataframe(
-                df=df,
-                table_name="player_game_stats_raw",
-                schema="staging",
-                if_exists="append",
-            )
+            rows_loaded = self._load_staging(stats, "player_game_stats_raw")
 
             logger.info(f"Successfully loaded {rows_loaded} player stats")
             return rows_loaded
@@ -3,14 +3,169 @@ NBA Data Transformer
 ====================
 Transforms raw NBA API data into clean, validated format.
 """
-import json
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple, Union
+
+import orjson
+import pandas as pd
 
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Date formats returned by the NBA API endpoints, tried in order
+DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%Y%m%d")
+
+# Team box score counting stats: transformed name -> raw LeagueGameFinder column
+GAME_COUNT_FIELDS = {
+    "field_goals_made": "FGM",
+    "field_goals_attempted": "FGA",
+    "three_pointers_made": "FG3M",
+    "three_pointers_attempted": "FG3A",
+    "free_throws_made": "FTM",
+    "free_throws_attempted": "FTA",
+    "offensive_rebounds": "OREB",
+    "defensive_rebounds": "DREB",
+    "total_rebounds": "REB",
+    "assists": "AST",
+    "steals": "STL",
+    "blocks": "BLK",
+    "turnovers": "TOV",
+    "personal_fouls": "PF",
+    "points": "PTS",
+}
+
+# Player box score counting stats: transformed name -> raw BoxScoreTraditionalV3 field
+PLAYER_COUNT_FIELDS = {
+    "field_goals_made": "fieldGoalsMade",
+    "field_goals_attempted": "fieldGoalsAttempted",
+    "three_pointers_made": "threePointersMade",
+    "three_pointers_attempted": "threePointersAttempted",
+    "free_throws_made": "freeThrowsMade",
+    "free_throws_attempted": "freeThrowsAttempted",
+    "offensive_rebounds": "reboundsOffensive",
+    "defensive_rebounds": "reboundsDefensive",
+    "total_rebounds": "reboundsTotal",
+    "assists": "assists",
+    "steals": "steals",
+    "blocks": "blocks",
+    "turnovers": "turnovers",
+    "personal_fouls": "foulsPersonal",
+    "points": "points",
+}
+
+# Shooting percentages, 0.0 when missing
+PLAYER_PCT_FIELDS = {
+    "field_goal_pct": "fieldGoalsPercentage",
+    "three_point_pct": "threePointersPercentage",
+    "free_throw_pct": "freeThrowsPercentage",
+}
+
+# Advanced metrics (BoxScoreAdvancedV3), NULL when missing or zero
+PLAYER_ADVANCED_FIELDS = {
+    "offensive_rating": "offensiveRating",
+    "defensive_rating": "defensiveRating",
+    "net_rating": "netRating",
+    "true_shooting_pct": "trueShootingPercentage",
+    "effective_fg_pct": "effectiveFieldGoalPercentage",
+    "usage_pct": "usagePercentage",
+    "pace": "pace",
+    "pie": "PIE",
+    # Assist metrics
+    "assist_percentage": "assistPercentage",
+    "assist_to_turnover": "assistToTurnover",
+    "assist_ratio": "assistRatio",
+    # Rebound metrics
+    "offensive_rebound_pct": "offensiveReboundPercentage",
+    "defensive_rebound_pct": "defensiveReboundPercentage",
+    "rebound_percentage": "reboundPercentage",
+    # Other advanced
+    "turnover_ratio": "turnoverRatio",
+}
+
+
+def _to_json(record: Dict) -> str:
+    """
+    Serialize a raw API record for the JSONB ``raw_data`` column.
+
+    orjson writes NaN as null (valid JSONB) and handles numpy scalars left in
+    records built from API DataFrames.
+    """
+    return orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def _column(df: pd.DataFrame, name: str, default: Any) -> pd.Series:
+    """Get a raw column with missing values (or a missing column) set to a default."""
+    if name not in df.columns:
+        return pd.Series([default] * len(df), index=df.index, dtype=object)
+    # Object dtype so a None default isn't turned back into NaN in float columns
+    return df[name].astype(object).where(df[name].notna(), default)
+
+
+def _count_column(df: pd.DataFrame, name: str) -> pd.Series:
+    """Get a raw counting stat as int32, treating missing or invalid values as 0."""
+    if name not in df.columns:
+        return pd.Series(0, index=df.index, dtype="int32")
+    return pd.to_numeric(df[name], errors="coerce").fillna(0).astype("int32")
+
+
+def _float_column(df: pd.DataFrame, name: str) -> pd.Series:
+    """Get a raw float stat, treating missing or invalid values as 0.0."""
+    if name not in df.columns:
+        return pd.Series(0.0, index=df.index)
+    return pd.to_numeric(df[name], errors="coerce").fillna(0.0).astype(float)
+
+
+def _optional_column(df: pd.DataFrame, name: str, integer: bool = False) -> pd.Series:
+    """Get a raw stat as Python numbers, None where it is missing, zero or invalid."""
+    if name not in df.columns:
+        return pd.Series([None] * len(df), index=df.index, dtype=object)
+
+    values = pd.to_numeric(df[name], errors="coerce")
+    present = values.notna() & (values != 0)
+    if integer:
+        values = values.where(present, 0).astype("int64")
+    return values.astype(object).where(present, None)
+
+
+def _identifier_mask(
+    df: pd.DataFrame, text_ids: Tuple[str, ...], numeric_ids: Tuple[str, ...]
+) -> pd.Series:
+    """Rows with every identifier present, the numeric ones parseable as numbers."""
+    if any(name not in df.columns for name in (*text_ids, *numeric_ids)):
+        return pd.Series(False, index=df.index)
+
+    valid = pd.Series(True, index=df.index)
+    for name in text_ids:
+        valid &= df[name].notna() & (df[name].astype(str).str.strip() != "")
+    for name in numeric_ids:
+        valid &= pd.to_numeric(df[name], errors="coerce").notna()
+    return valid
+
+
+def _log_skipped(df: pd.DataFrame, valid: pd.Series, kind: str, id_columns: Tuple[str, ...]):
+    """Warn about each row dropped for missing or invalid identifiers."""
+    columns = [name for name in id_columns if name in df.columns]
+    for ids in df.loc[~valid, columns].to_dict("records"):
+        logger.warning("Skipping %s with missing or invalid identifiers: %s", kind, ids)
+
+
+def _date_formats_for(dates: pd.Series) -> List[str]:
+    """Order ``DATE_FORMATS`` so the one matching the first date is tried first."""
+    formats = list(DATE_FORMATS)
+    if dates.empty:
+        return formats
+
+    for fmt in DATE_FORMATS:
+        try:
+            datetime.strptime(dates.iloc[0], fmt)
+        except ValueError:
+            continue
+        formats.remove(fmt)
+        return [fmt, *formats]
+
+    return formats
+
 
 class NBATransformer:
     """
@@ -26,221 +181,183 @@ class NBATransformer:
     def __init__(self):
         logger.info("NBA Transformer initialized")
 
-    def transform_games(self, games: List[Dict]) -> List[Dict]:
+    def transform_games(
+        self, games: Union[List[Dict], pd.DataFrame]
+    ) -> Union[List[Dict], pd.DataFrame]:
         """
         Transform raw game data.
 
+        DataFrame input (e.g. ``NBAExtractor.get_games_by_date(..., as_frame=True)``)
+        stays a DataFrame end to end and is returned as one, ready for
+        ``PostgresLoader.load_games_staging``; no per-row dictionaries are built.
+
         Args:
-            games: List of raw game dictionaries
+            games: List of raw game dictionaries, or a DataFrame of raw games
 
         Returns:
-            List of transformed game dictionaries
+            List of transformed game dictionaries (DataFrame for DataFrame input)
         """
-        logger.info(f"Transforming {len(games)} games")
-
-        transformed = []
-        for game in games:
-            try:
-                cleaned_game = {
-                    "game_id": str(game.get("GAME_ID")),
-                    "team_id": int(game.get("TEAM_ID", 0)),
-                    "team_name": game.get("TEAM_NAME", ""),
-                    "game_date": self._parse_date(game.get("GAME_DATE")),
-                    "matchup": game.get("MATCHUP", ""),
-                    "is_home": "@" not in game.get("MATCHUP", ""),
-                    "win_loss": game.get("WL", "L"),
-                    "field_goals_made": int(game.get("FGM", 0)),
-                    "field_goals_attempted": int(game.get("FGA", 0)),
-                    "three_pointers_made": int(game.get("FG3M", 0)),
-                    "three_pointers_attempted": int(game.get("FG3A", 0)),
-                    "free_throws_made": int(game.get("FTM", 0)),
-                    "free_throws_attempted": int(game.get("FTA", 0)),
-                    "offensive_rebounds": int(game.get("OREB", 0)),
-                    "defensive_rebounds": int(game.get("DREB", 0)),
-                    "total_rebounds": int(game.get("REB", 0)),
-                    "assists": int(game.get("AST", 0)),
-                    "steals": int(game.get("STL", 0)),
-                    "blocks": int(game.get("BLK", 0)),
-                    "turnovers": int(game.get("TOV", 0)),
-                    "personal_fouls": int(game.get("PF", 0)),
-                    "points": int(game.get("PTS", 0)),
-                    "raw_data": json.dumps(game),  # Store original API response as JSONB
-                }
-                transformed.append(cleaned_game)
-            except Exception as e:
-                logger.warning(f"Failed to transform game {game.get('GAME_ID')}: {str(e)}")
-                continue
-
-        logger.info(f"Successfully transformed {len(transformed)} games")
+        logger.info("Transforming %s games", len(games))
+
+        as_frame = isinstance(games, pd.DataFrame)
+        if len(games) == 0:
+            return pd.DataFrame() if as_frame else []
+
+        # Columns are converted as whole arrays; rows only exist again at the end
+        df = games.reset_index(drop=True) if as_frame else pd.DataFrame(games)
+
+        # Rows without usable identifiers would fail the NOT NULL staging columns
+        valid = _identifier_mask(df, text_ids=("GAME_ID",), numeric_ids=("TEAM_ID",))
+        if not valid.all():
+            _log_skipped(df, valid, "game", ("GAME_ID", "TEAM_ID"))
+            if not as_frame:
+                games = [game for game, keep in zip(games, valid) if keep]
+            df = df[valid].reset_index(drop=True)
+            if df.empty:
+                return pd.DataFrame() if as_frame else []
+
+        # Both paths serialize the same records with orjson (list input usually is
+        # the extractor's DataFrame.to_dict("records")), so a game's JSONB doesn't
+        # depend on which path loaded it
+        raw_data = list(map(_to_json, df.to_dict("records") if as_frame else games))
+
+        matchup = _column(df, "MATCHUP", "").astype(str)
+
+        transformed = pd.DataFrame(
+            {
+                "game_id": df["GAME_ID"].astype(str),
+                "team_id": _count_column(df, "TEAM_ID"),
+                "team_name": _column(df, "TEAM_NAME", ""),
+                "game_date": self._parse_dates(_column(df, "GAME_DATE", None)),
+                "matchup": matchup,
+                "is_home": ~matchup.str.contains("@", regex=False),
+                "win_loss": _column(df, "WL", "L"),
+                **{field: _count_column(df, raw) for field, raw in GAME_COUNT_FIELDS.items()},
+                # Store original API response as JSONB
+                "raw_data": raw_data,
+            }
+        )
+
+        if not as_frame:
+            transformed = transformed.to_dict("records")
+
+        logger.info("Successfully transformed %s games", len(transformed))
 
         return transformed
 
-    def transform_player_stats(self, stats: List[Dict]) -> List[Dict]:
+    def transform_player_stats(
+        self, stats: List[Dict], as_frame: bool = False
+    ) -> Union[List[Dict], pd.DataFrame]:
         """
         Transform raw player statistics.
 
         Args:
             stats: List of raw player stat dictionaries
+            as_frame: Return the columnar DataFrame instead of record dictionaries,
+                      e.g. to pass straight to ``calculate_advanced_metrics``
 
         Returns:
-            List of transformed stat dictionaries
+            List of transformed stat dictionaries (DataFrame if as_frame)
         """
-        logger.info(f"Transforming {len(stats)} player stat records")
-
-        transformed = []
-        for stat in stats:
-            try:
-                # Parse minutes from "MM:SS" format to decimal
-                minutes_str = stat.get("minutes", "0:00")
-                minutes_played = self._parse_minutes(minutes_str)
-
-                cleaned_stat = {
-                    # Identifiers
-                    "game_id": str(stat.get("gameId")),
-                    "team_id": int(stat.get("teamId", 0)),
-                    "player_id": int(stat.get("personId", 0)),
-                    "player_name": (
-                        f"{stat.get('firstName', '')} {stat.get('familyName', '')}".strip()
-                    ),
-                    # Player details
-                    "position": stat.get("position", ""),
-                    "jersey_num": stat.get("jerseyNum", ""),
-                    # Playing time
-                    "minutes_played": minutes_played,
-                    # Shooting stats
-                    "field_goals_made": int(stat.get("fieldGoalsMade", 0)),
-                    "field_goals_attempted": int(stat.get("fieldGoalsAttempted", 0)),
-                    "field_goal_pct": float(stat.get("fieldGoalsPercentage", 0.0)),
-                    "three_pointers_made": int(stat.get("threePointersMade", 0)),
-                    "three_pointers_attempted": int(stat.get("threePointersAttempted", 0)),
-                    "three_point_pct": float(stat.get("threePointersPercentage", 0.0)),
-                    "free_throws_made": int(stat.get("freeThrowsMade", 0)),
-                    "free_throws_attempted": int(stat.get("freeThrowsAttempted", 0)),
-                    "free_throw_pct": float(stat.get("freeThrowsPercentage", 0.0)),
-                    # Rebounds
-                    "offensive_rebounds": int(stat.get("reboundsOffensive", 0)),
-                    "defensive_rebounds": int(stat.get("reboundsDefensive", 0)),
-                    "total_rebounds": int(stat.get("reboundsTotal", 0)),
-                    # Other stats
-                    "assists": int(stat.get("assists", 0)),
-                    "steals": int(stat.get("steals", 0)),
-                    "blocks": int(stat.get("blocks", 0)),
-                    "turnovers": int(stat.get("turnovers", 0)),
-                    "personal_fouls": int(stat.get("foulsPersonal", 0)),
-                    "points": int(stat.get("points", 0)),
-                    "plus_minus": int(stat.get("plusMinusPoints", 0))
-                    if stat.get("plusMinusPoints")
-                    else None,
-                    # Advanced metrics
-                    "offensive_rating": float(stat.get("offensiveRating", 0.0))
-                    if stat.get("offensiveRating")
-                    else None,
-                    "defensive_rating": float(stat.get("defensiveRating", 0.0))
-                    if stat.get("defensiveRating")
-                    else None,
-                    "net_rating": float(stat.get("netRating", 0.0))
-                    if stat.get("netRating")
-                    else None,
-                    "true_shooting_pct": float(stat.get("trueShootingPercentage", 0.0))
-                    if stat.get("trueShootingPercentage")
-                    else None,
-                    "effective_fg_pct": float(stat.get("effectiveFieldGoalPercentage", 0.0))
-                    if stat.get("effectiveFieldGoalPercentage")
-                    else None,
-                    "usage_pct": float(stat.get("usagePercentage", 0.0))
-                    if stat.get("usagePercentage")
-                    else None,
-                    "pace": float(stat.get("pace", 0.0)) if stat.get("pace") else None,
-                    "pie": float(stat.get("PIE", 0.0)) if stat.get("PIE") else None,
-                    # Assist metrics
-                    "assist_percentage": float(stat.get("assistPercentage", 0.0))
-                    if stat.get("assistPercentage")
-                    else None,
-                    "assist_to_turnover": float(stat.get("assistToTurnover", 0.0))
-                    if stat.get("assistToTurnover")
-                    else None,
-                    "assist_ratio": float(stat.get("assistRatio", 0.0))
-                    if stat.get("assistRatio")
-                    else None,
-                    # Rebound metrics
-                    "offensive_rebound_pct": float(stat.get("offensiveReboundPercentage", 0.0))
-                    if stat.get("offensiveReboundPercentage")
-                    else None,
-                    "defensive_rebound_pct": float(stat.get("defensiveReboundPercentage", 0.0))
-                    if stat.get("defensiveReboundPercentage")
-                    else None,
-                    "rebound_percentage": float(stat.get("reboundPercentage", 0.0))
-                    if stat.get("reboundPercentage")
-                    else None,
-                    # Other advanced
-                    "turnover_ratio": float(stat.get("turnoverRatio", 0.0))
-                    if stat.get("turnoverRatio")
-                    else None,
-                    # Raw data
-                    "raw_data": json.dumps(stat),
-                }
-                transformed.append(cleaned_stat)
-            except Exception as e:
-                logger.warning(
-                    f"Failed to transform player stat for player {stat.get('personId')}: {str(e)}"
-                )
-                continue
-
-        logger.info(f"Successfully transformed {len(transformed)} player stat records")
+        logger.info("Transforming %s player stat records", len(stats))
+
+        if not stats:
+            return pd.DataFrame() if as_frame else []
+
+        # Same column-wise conversion as transform_games, driven by the field tables
+        df = pd.DataFrame(stats)
+
+        valid = _identifier_mask(df, text_ids=("gameId",), numeric_ids=("teamId", "personId"))
+        if not valid.all():
+            _log_skipped(df, valid, "player stat", ("gameId", "teamId", "personId"))
+            stats = [stat for stat, keep in zip(stats, valid) if keep]
+            df = df[valid].reset_index(drop=True)
+            if df.empty:
+                return pd.DataFrame() if as_frame else []
+
+        player_name = (
+            _column(df, "firstName", "").astype(str)
+            + " "
+            + _column(df, "familyName", "").astype(str)
+        )
+
+        transformed = pd.DataFrame(
+            {
+                # Identifiers
+                "game_id": df["gameId"].astype(str),
+                "team_id": _count_column(df, "teamId"),
+                "player_id": _count_column(df, "personId"),
+                "player_name": player_name.str.strip(),
+                # Player details
+                "position": _column(df, "position", ""),
+                "jersey_num": _column(df, "jerseyNum", None),
+                # Playing time, from "MM:SS" format to decimal
+                "minutes_played": self._parse_minutes_series(_column(df, "minutes", "0:00")),
+                # Box score stats
+                **{field: _count_column(df, raw) for field, raw in PLAYER_COUNT_FIELDS.items()},
+                **{field: _float_column(df, raw) for field, raw in PLAYER_PCT_FIELDS.items()},
+                "plus_minus": _optional_column(df, "plusMinusPoints", integer=True),
+                # Advanced metrics
+                **{
+                    field: _optional_column(df, raw)
+                    for field, raw in PLAYER_ADVANCED_FIELDS.items()
+                },
+                # Raw data
+                "raw_data": list(map(_to_json, stats)),
+            }
+        )
+
+        if not as_frame:
+            transformed = transformed.to_dict("records")
+
+        logger.info("Successfully transformed %s player stat records", len(transformed))
         return transformed
 
-    def _parse_minutes(self, minutes_str: str) -> float:
+    def _parse_minutes_series(self, minutes: pd.Series) -> pd.Series:
         """
-        Parse minutes from MM:SS format to decimal minutes.
+        Parse a column of MM:SS strings to decimal minutes.
+
+        Values not in MM:SS format give 0.0.
 
         Args:
-            minutes_str: Minutes in "MM:SS" format
+            minutes: Series of minutes in "MM:SS" format
 
         Returns:
-            Decimal minutes
+            Float Series of decimal minutes
         """
-        try:
-            if not minutes_str or minutes_str == "":
-                return 0.0
-
-            parts = minutes_str.split(":")
-            if len(parts) != 2:
-                return 0.0
-
-            minutes = int(parts[0])
-            seconds = int(parts[1])
+        parts = minutes.astype(str).str.extract(r"^\s*(\d+):(\d+)\s*$").astype(float)
+        return (parts[0] + parts[1] / 60.0).fillna(0.0).round(2)
 
-            return round(minutes + (seconds / 60.0), 2)
-        except Exception:
-            return 0.0
-
-    def _parse_date(self, date_str: str) -> str:
+    def _parse_dates(self, dates: pd.Series) -> pd.Series:
         """
-        Parse date string to standardized format.
+        Parse a column of date strings to standardized format.
+
+        Each of ``DATE_FORMATS`` is tried on the values still unparsed, starting
+        with the format of the first value (API responses use one format
+        throughout, so usually a single pass parses everything).
 
         Args:
-            date_str: Date string in various formats
+            dates: Series of date strings in various formats
 
         Returns:
-            Date in YYYY-MM-DD format
+            Object Series of YYYY-MM-DD strings, None where parsing failed
         """
-        if not date_str:
-            return None
-
-        try:
-            # Try common NBA API formats
-            for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%Y%m%d"]:
-                try:
-                    dt = datetime.strptime(str(date_str), fmt)
-                    return dt.strftime("%Y-%m-%d")
-                except ValueError:
-                    continue
-
-            logger.warning(f"Could not parse date: {date_str}")
-            return None
-        except Exception as e:
-            logger.error(f"Error parsing date {date_str}: {str(e)}")
-            return None
+        as_text = dates.astype(str)
+        parsed = pd.Series(pd.NaT, index=dates.index, dtype="datetime64[ns]")
+        for fmt in _date_formats_for(as_text[dates.notna()]):
+            # Later formats only see the values earlier ones could not parse
+            pending = parsed.isna() & dates.notna()
+            if not pending.any():
+                break
+            parsed[pending] = pd.to_datetime(as_text[pending], format=fmt, errors="coerce")
+
+        unparsed = parsed.isna() & dates.notna()
+        if unparsed.any():
+            logger.warning(
+                "Could not parse %s dates, e.g. %s", unparsed.sum(), dates[unparsed].iloc[0]
+            )
+
+        return parsed.dt.strftime("%Y-%m-%d").astype(object).where(parsed.notna(), None)
 
     def validate_data(self, data: List[Dict], required_fields: List[str]) -> bool:
         """
@@ -257,10 +374,12 @@ class NBATransformer:
             logger.warning("Empty data provided for validation")
             return False
 
+        # One C-level subset test per record; the field list is only built on failure
+        required = set(required_fields)
         for idx, record in enumerate(data):
-            missing_fields = [f for f in required_fields if f not in record]
-            if missing_fields:
-                logger.error(f"Record {idx} missing required fields: {missing_fields}")
+            if not required <= record.keys():
+                missing_fields = [f for f in required_fields if f not in record]
+                logger.error("Record %s missing required fields: %s", idx, missing_fields)
                 return False
 
         logger.info("Data validation passed")
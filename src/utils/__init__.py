@@ -3,5 +3,6 @@
 from .config import Config
 from .database import DatabaseConnection
 from .logger import get_logger
+from .rate_limiter import TokenBucketLimiter
 
-__all__ = ["get_logger", "Config", "DatabaseConnection"]
+__all__ = ["get_logger", "Config", "DatabaseConnection", "TokenBucketLimiter"]
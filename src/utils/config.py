@@ -25,6 +25,8 @@ class Config:
 
     # NBA API
     NBA_API_RATE_LIMIT: int = int(os.getenv("NBA_API_RATE_LIMIT", "600"))
+    # SQLite response cache for NBA API requests (off unless set, e.g. by docker-compose)
+    NBA_API_CACHE_PATH: str = os.getenv("NBA_API_CACHE_PATH", "")
 
     # Application
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
@@ -4,13 +4,18 @@ Data Quality Checker
 Validates data quality across the pipeline.
 """
 
-from typing import Any, Dict
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union
 
 from .database import DatabaseConnection
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Plain (unquoted) SQL column names accepted by checks that interpolate them
+_COLUMN_NAME = re.compile(r"^[a-z_][a-z0-9_]*$")
+
 
 class DataQualityChecker:
     """Check data quality across tables."""
@@ -30,21 +35,28 @@ class DataQualityChecker:
         Returns:
             Dictionary with check results
         """
-        results = {}
-        for column in columns:
-            query = f"""
-                SELECT COUNT(*) as null_count
-                FROM {table}
-                WHERE {column} IS NULL
-            """
-            df = self.db.execute_query(query)
-            null_count = df.iloc[0]["null_count"]
-            results[column] = {"null_count": null_count, "passed": null_count == 0}
-
-        return results
+        if not columns:
+            return {}
+
+        # All columns are counted in one scan and returned as a single array value
+        null_counts = ",\n                ".join(
+            f"COUNT(*) FILTER (WHERE {column} IS NULL)" for column in columns
+        )
+        query = f"""
+            SELECT ARRAY[
+                {null_counts}
+            ]
+            FROM {table}
+        """
+        counts = self.db.execute_scalar(query)
+
+        return {
+            column: {"null_count": null_count, "passed": null_count == 0}
+            for column, null_count in zip(columns, counts)
+        }
 
     def check_referential_integrity(
-        self, child_table: str, parent_table: str, foreign_key: str
+        self, child_table: str, parent_table: str, foreign_key: Union[str, List[str]]
     ) -> bool:
         """
         Check referential integrity between tables.
@@ -52,47 +64,70 @@ class DataQualityChecker:
         Args:
             child_table: Child table name
             parent_table: Parent table name
-            foreign_key: Foreign key column name
+            foreign_key: Foreign key column name, or column names of a composite key
 
         Returns:
             True if all foreign keys are valid
         """
+        key_columns = [foreign_key] if isinstance(foreign_key, str) else list(foreign_key)
+        invalid = [column for column in key_columns if not _COLUMN_NAME.match(column)]
+        if invalid:
+            raise ValueError(f"Invalid column names: {invalid}")
+
+        key_match = " AND ".join(f"p.{column} = c.{column}" for column in key_columns)
+
+        # Anti-join; EXISTS stops at the first orphan instead of counting them all
         query = f"""
-            SELECT COUNT(*) as orphan_count
-            FROM {child_table} c
-            LEFT JOIN {parent_table} p ON c.{foreign_key} = p.{foreign_key}
-            WHERE p.{foreign_key} IS NULL
+            SELECT EXISTS (
+                SELECT 1
+                FROM {child_table} c
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM {parent_table} p WHERE {key_match}
+                )
+            ) as has_orphans
         """
 
-        df = self.db.execute_query(query)
-        orphan_count = df.iloc[0]["orphan_count"]
-
-        return orphan_count == 0
+        return not self.db.execute_scalar(query)
 
-    def check_duplicates(self, table: str, unique_columns: list) -> int:
+    def check_duplicates(
+        self, table: str, unique_columns: list, sample_pct: Optional[float] = None
+    ) -> int:
         """
         Check for duplicate records.
 
         Args:
             table: Table name
             unique_columns: Columns that should be unique together
+            sample_pct: Only check a TABLESAMPLE SYSTEM sample of this many percent
+                of the table's pages (for monitoring on large tables)
 
         Returns:
-            Number of duplicate records
+            Number of duplicate records (rows beyond the first of each key). With
+            ``sample_pct``, only duplicates whose copies all landed in the sample are
+            counted: a non-zero result proves duplicates exist, but the count is a
+            lower bound, not an estimate of the table-wide number
         """
+        invalid = [column for column in unique_columns if not _COLUMN_NAME.match(column)]
+        if invalid:
+            raise ValueError(f"Invalid column names: {invalid}")
+
         columns_str = ", ".join(unique_columns)
+        sample = f" TABLESAMPLE SYSTEM ({float(sample_pct)})" if sample_pct else ""
+
+        # One aggregate instead of GROUP BY ... HAVING plus an outer count; ROW() keeps
+        # NULL keys counted like GROUP BY does
         query = f"""
-            SELECT COUNT(*) as duplicate_count
-            FROM (
-                SELECT {columns_str}, COUNT(*) as cnt
-                FROM {table}
-                GROUP BY {columns_str}
-                HAVING COUNT(*) > 1
-            ) duplicates
+            SELECT COUNT(*) - COUNT(DISTINCT ROW({columns_str})) as duplicate_count
+            FROM {table}{sample}
         """
 
-        df = self.db.execute_query(query)
-        return df.iloc[0]["duplicate_count"]
+        return self.db.execute_scalar(query)
+
+
+@lru_cache(maxsize=None)
+def get_checker() -> DataQualityChecker:
+    """Get the shared checker, so its engine and connection pool are reused across runs."""
+    return DataQualityChecker()
 
 
 def run_data_quality_checks() -> Dict[str, Any]:
@@ -104,7 +139,7 @@ def run_data_quality_checks() -> Dict[str, Any]:
     """
     logger.info("Running data quality checks")
 
-    DataQualityChecker()
+    get_checker()
 
     results = {
         "total_checks": 0,
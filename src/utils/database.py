@@ -4,18 +4,38 @@ Database Connection Utilities
 Database connection and query utilities.
 """
 
+import io
 from contextlib import contextmanager
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
-from sqlalchemy import create_engine, text
+from psycopg2.extras import execute_values
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import TextClause
 
 from .config import Config
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Rows serialized per COPY FROM STDIN batch, so large loads keep a flat CSV buffer
+COPY_CHUNK_ROWS = 50_000
+
+
+@lru_cache(maxsize=None)
+def _insert_template(schema: str, table_name: str, columns: Tuple[str, ...]) -> Tuple[str, str]:
+    """
+    Build (once per table and column set) an ``execute_values`` INSERT.
+
+    Returns:
+        Tuple of (INSERT statement with a ``VALUES %s`` slot, named-parameter row template)
+    """
+    insert_sql = f"INSERT INTO {schema}.{table_name} ({', '.join(columns)}) VALUES %s"
+    row_template = "(" + ", ".join(f"%({column})s" for column in columns) + ")"
+    return insert_sql, row_template
+
 
 class DatabaseConnection:
     """PostgreSQL database connection manager."""
@@ -28,10 +48,17 @@ class DatabaseConnection:
             connection_string: PostgreSQL connection string.
                              If None, uses Config.database_url
         """
-        self.connection_string = connection_string or Config().database_url
+        self._connection_string = connection_string
         self._engine: Optional[Engine] = None
         logger.info("Database connection initialized")
 
+    @property
+    def connection_string(self) -> str:
+        """Get the connection string, resolving the configured URL on first use."""
+        if self._connection_string is None:
+            self._connection_string = Config().database_url
+        return self._connection_string
+
     @property
     def engine(self) -> Engine:
         """Get SQLAlchemy engine (lazy initialization)."""
@@ -41,6 +68,8 @@ class DatabaseConnection:
                 pool_size=10,
                 max_overflow=20,
                 pool_pre_ping=True,  # Verify connections before using
+                pool_recycle=1800,
+                pool_use_lifo=True,  # Reuse the most recently returned (warm) connection
                 echo=False,
             )
             logger.info("Database engine created")
@@ -55,33 +84,97 @@ class DatabaseConnection:
             conn.commit()
         except Exception as e:
             conn.rollback()
-            logger.error(f"Database error: {str(e)}")
+            logger.error("Database error: %s", e)
+            raise
+        finally:
+            conn.close()
+
+    @contextmanager
+    def get_readonly_connection(self):
+        """
+        Context manager for read-only connections.
+
+        Runs in autocommit mode, so SELECTs are sent without BEGIN/COMMIT
+        round-trips, and marks the session read-only.
+        """
+        conn = self.engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT", postgresql_readonly=True
+        )
+        try:
+            yield conn
+        except Exception as e:
+            logger.error("Database error: %s", e)
             raise
         finally:
             conn.close()
 
-    def execute_query(self, query: str, params: Optional[tuple] = None) -> pd.DataFrame:
+    def execute_query(
+        self,
+        query: Union[str, TextClause],
+        params: Optional[Dict[str, Any]] = None,
+        dtype_backend: Optional[str] = None,
+    ) -> pd.DataFrame:
         """
         Execute a SELECT query and return results as DataFrame.
 
         Args:
-            query: SQL query string
-            params: Optional query parameters
+            query: SQL query string or a prebuilt ``text()`` statement, which
+                callers can keep at module scope so it is compiled only once
+            params: Optional named parameters for ``:name`` bind placeholders
+            dtype_backend: Optional pandas dtype backend for the result
+                ('pyarrow' or 'numpy_nullable'); NumPy dtypes if None
 
         Returns:
             Query results as pandas DataFrame
         """
+        if isinstance(query, str):
+            query = text(query)
+
         try:
-            with self.get_connection() as conn:
-                if params:
-                    result = pd.read_sql(text(query), conn, params=params)
-                else:
-                    result = pd.read_sql(query, conn)
+            with self.get_readonly_connection() as conn:
+                # Read the DBAPI cursor directly: SQLAlchemy still compiles and binds
+                # the statement, but no Row object is built per result row
+                cursor_result = conn.execute(query, params or {})
+                cursor = cursor_result.cursor
+                columns = [column[0] for column in cursor.description]
+                rows = cursor.fetchall()
+                cursor_result.close()
+
+                # coerce_float turns NUMERIC (Decimal) values into floats like read_sql
+                result = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+                if dtype_backend:
+                    result = result.convert_dtypes(dtype_backend=dtype_backend)
 
-                logger.info(f"Query executed successfully, returned {len(result)} rows")
+                logger.info("Query executed successfully, returned %s rows", len(result))
                 return result
         except Exception as e:
-            logger.error(f"Query execution failed: {str(e)}")
+            logger.error("Query execution failed: %s", e)
+            raise
+
+    def execute_scalar(
+        self, query: Union[str, TextClause], params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Execute a SELECT query and return the first column of its first row.
+
+        Cheaper than ``execute_query`` for single-value results (counts,
+        flags), as no DataFrame is built.
+
+        Args:
+            query: SQL query string or a prebuilt ``text()`` statement
+            params: Optional named parameters for ``:name`` bind placeholders
+
+        Returns:
+            The value, or None if the query returned no rows
+        """
+        if isinstance(query, str):
+            query = text(query)
+
+        try:
+            with self.get_readonly_connection() as conn:
+                return conn.execute(query, params or {}).scalar()
+        except Exception as e:
+            logger.error("Query execution failed: %s", e)
             raise
 
     def execute_sql(self, query: str, params: Optional[Dict[str, Any]] = None) -> None:
@@ -101,7 +194,7 @@ class DatabaseConnection:
 
                 logger.info("SQL statement executed successfully")
         except Exception as e:
-            logger.error(f"SQL execution failed: {str(e)}")
+            logger.error("SQL execution failed: %s", e)
             raise
 
     def insert_dataframe(
@@ -114,6 +207,10 @@ class DatabaseConnection:
         """
         Insert a pandas DataFrame into a database table.
 
+        Rows are always loaded with ``copy_dataframe`` (COPY FROM STDIN). When the
+        table has to be created or replaced, ``DataFrame.to_sql`` is only used
+        with an empty frame to create the table from the DataFrame's dtypes.
+
         Args:
             df: DataFrame to insert
             table_name: Target table name
@@ -123,22 +220,120 @@ class DatabaseConnection:
         Returns:
             Number of rows inserted
         """
+        if if_exists != "append" or not inspect(self.engine).has_table(table_name, schema=schema):
+            try:
+                df.head(0).to_sql(
+                    name=table_name,
+                    con=self.engine,
+                    schema=schema,
+                    if_exists=if_exists,
+                    index=False,
+                )
+            except Exception as e:
+                logger.error("DataFrame insertion failed: %s", e)
+                raise
+
+        return self.copy_dataframe(df=df, table_name=table_name, schema=schema)
+
+    def insert_records(
+        self,
+        records: List[Dict],
+        table_name: str,
+        schema: str = "public",
+        synchronous_commit: bool = True,
+    ) -> int:
+        """
+        Insert a few records with ``execute_values``, without building a DataFrame.
+
+        All rows are sent as multi-row VALUES pages instead of one INSERT each.
+
+        For small batches the pandas conversion and CSV serialization of
+        ``copy_dataframe`` cost more than the insert itself.
+
+        Args:
+            records: Records to insert; a key missing from some records is NULL there
+            table_name: Target table name
+            schema: Database schema
+            synchronous_commit: If False, don't wait for the WAL flush on commit
+
+        Returns:
+            Number of rows inserted
+        """
+        columns = tuple(dict.fromkeys(key for record in records for key in record))
+        insert_sql, row_template = _insert_template(schema, table_name, columns)
+        params = [{**dict.fromkeys(columns), **record} for record in records]
+
+        conn = self.engine.raw_connection()
         try:
-            df.to_sql(
-                name=table_name,
-                con=self.engine,
-                schema=schema,
-                if_exists=if_exists,
-                index=False,
-                method="multi",
-                chunksize=1000,
-            )
+            with conn.cursor() as cursor:
+                if not synchronous_commit:
+                    cursor.execute("SET LOCAL synchronous_commit = off")
+                execute_values(cursor, insert_sql, params, template=row_template)
+            conn.commit()
+
+            logger.info("Inserted %s rows into %s.%s", len(records), schema, table_name)
+            return len(records)
+        except Exception as e:
+            conn.rollback()
+            logger.error("Insert into %s.%s failed: %s", schema, table_name, e)
+            raise
+        finally:
+            conn.close()
+
+    def copy_dataframe(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        schema: str = "public",
+        synchronous_commit: bool = True,
+    ) -> int:
+        """
+        Bulk load a pandas DataFrame into an existing table using COPY FROM STDIN.
+
+        Much faster than row-based INSERTs for staging loads: the frame is
+        serialized to CSV in memory, ``COPY_CHUNK_ROWS`` rows at a time, and
+        streamed to PostgreSQL in a single transaction.
+
+        Args:
+            df: DataFrame to load (columns must exist in the target table)
+            table_name: Target table name
+            schema: Database schema
+            synchronous_commit: If False, don't wait for the WAL flush on commit
+                (for reloadable data such as staging tables)
 
-            logger.info(f"Inserted {len(df)} rows into {schema}.{table_name}")
+        Returns:
+            Number of rows loaded
+        """
+        # convert_dtypes keeps integer columns with NULLs as integers (no "15.0")
+        df_copy = df.convert_dtypes()
+
+        columns = ", ".join(df.columns)
+        copy_sql = (
+            f"COPY {schema}.{table_name} ({columns}) FROM STDIN WITH (FORMAT CSV, NULL '\\N')"
+        )
+
+        conn = self.engine.raw_connection()
+        try:
+            with conn.cursor() as cursor:
+                if not synchronous_commit:
+                    cursor.execute("SET LOCAL synchronous_commit = off")
+                for start in range(0, len(df_copy), COPY_CHUNK_ROWS):
+                    buffer = io.StringIO()
+                    df_copy.iloc[start : start + COPY_CHUNK_ROWS].to_csv(
+                        buffer, index=False, header=False, na_rep="\\N"
+                    )
+                    buffer.seek(0)
+                    cursor.copy_expert(copy_sql, buffer)
+            conn.commit()
+
+            logger.info("Copied %s rows into %s.%s", len(df), schema, table_name)
             return len(df)
         except Exception as e:
-            logger.error(f"DataFrame insertion failed: {str(e)}")
+            conn.rollback()
+            logger.error("COPY into %s.%s failed: %s", schema, table_name, e)
             raise
+        finally:
+            conn.close()
 
     def close(self):
         """Close database connection."""
@@ -8,6 +8,26 @@ import logging
 import sys
 from typing import Optional
 
+# One stdout handler (and formatter) shared by every logger from get_logger
+_HANDLER = logging.StreamHandler(sys.stdout)
+_HANDLER.setFormatter(
+    logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+)
+
+# Package loggers ("src.*") reach the handler through this parent; it writes
+# to stdout itself, so it doesn't hand records on to root handlers as well
+_PACKAGE_LOGGER = logging.getLogger(__name__.split(".")[0])
+_PACKAGE_LOGGER.addHandler(_HANDLER)
+_PACKAGE_LOGGER.propagate = False
+
+
+def _is_package_logger(name: str) -> bool:
+    """Whether ``name`` is the package logger or one of its children."""
+    return name == _PACKAGE_LOGGER.name or name.startswith(_PACKAGE_LOGGER.name + ".")
+
 
 def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     """
@@ -27,14 +47,8 @@ def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
         level = "INFO"
     logger.setLevel(getattr(logging, level.upper()))
 
-    # Create handler if not already configured
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+    # Loggers outside the package (DAGs, scripts) don't inherit the handler
+    if not _is_package_logger(name) and _HANDLER not in logger.handlers:
+        logger.addHandler(_HANDLER)
 
     return logger
@@ -0,0 +1,91 @@
+"""
+Rate Limiter
+============
+Thread-safe token bucket used to pace requests to external APIs.
+"""
+
+import threading
+import time
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TokenBucketLimiter:
+    """
+    Token bucket allowing ``rate`` requests per ``per`` seconds.
+
+    Requests are spaced evenly (one token every ``per / rate`` seconds) instead
+    of being let through in a burst at the start of each window. Callers can
+    also push the next allowed request back, e.g. when the server sends
+    ``Retry-After``.
+    """
+
+    def __init__(self, rate: int, per: float = 60.0, burst: int = 1):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Number of requests allowed per period
+            per: Period length in seconds (default: 60)
+            burst: Requests that may be sent back to back after an idle period
+        """
+        self.rate = rate
+        self.per = per
+        self.burst = burst
+        self._interval = per / rate
+        self._next_slot = 0.0
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Wait until a request may be sent.
+
+        The send time is reserved under the lock and the wait happens outside
+        it, so concurrent callers queue up one interval apart. Unused capacity
+        accumulates up to ``burst`` requests.
+
+        Returns:
+            Seconds waited
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(
+                self._next_slot,
+                self._blocked_until,
+                now - (self.burst - 1) * self._interval,
+            )
+            self._next_slot = slot + self._interval
+
+            wait = max(slot - now, 0.0)
+
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
+
+    def limit_to(self, rate: int) -> bool:
+        """
+        Lower the allowed rate to ``rate`` requests per period (never raises it).
+
+        Slots already handed out keep their spacing; later ones use the new one.
+
+        Returns:
+            True if the rate was lowered
+        """
+        with self._lock:
+            if rate >= self.rate:
+                return False
+            self.rate = rate
+            self._interval = self.per / rate
+
+        return True
+
+    def defer(self, seconds: float):
+        """Hold back all requests for the given number of seconds."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+        logger.warning("Rate limited by server. Holding requests for %.2f seconds", seconds)
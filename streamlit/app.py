@@ -14,9 +14,11 @@ Features:
 import os
 import sys
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from sqlalchemy import text
 
 import streamlit as st
 
@@ -55,45 +57,49 @@ st.markdown(
 )
 
 
-@st.cache_resource
-def get_db_connection():
-    """Get database connection (cached)"""
-    return DatabaseConnection()
+# Arrow-backed results are smaller in memory and cheaper for st.cache_data to pickle
+QUERY_DTYPE_BACKEND = "pyarrow"
 
+# Stats shown on the player comparison table and radar chart
+COMPARISON_STATS = ["PPG", "RPG", "APG", "FG%", "PER", "Win Shares"]
 
-@st.cache_data(ttl=3600)
-def load_league_leaders(stat: str, season: str = "2024-25", limit: int = 10):
-    """Load league leaders for a specific stat"""
-    db = get_db_connection()
+# Stat categories of the league leaders page and the columns they rank by
+LEADER_STAT_COLUMNS = {
+    "Points": "ppg",
+    "Rebounds": "rpg",
+    "Assists": "apg",
+    "Steals": "spg",
+    "Blocks": "bpg",
+    "PER": "per",
+    "Win Shares": "win_shares",
+}
+
+# Columns load_league_leaders accepts
+LEADER_STATS = tuple(LEADER_STAT_COLUMNS.values())
 
-    query = f"""
+_LEADERS_SQL = """
     SELECT
         p.player_name,
         t.team_abbreviation,
-        pss.{stat},
+        pss."{stat}",
         pss.games_played,
         pss.mpg
     FROM player_season_stats pss
     JOIN dim_players p ON pss.player_key = p.player_key
     JOIN dim_teams t ON pss.team_key = t.team_key
-    WHERE pss.season_id = %s
+    WHERE pss.season_id = :season
         AND pss.games_played >= 20  -- Minimum games qualifier
-    ORDER BY pss.{stat} DESC
-    LIMIT %s
-    """
-
-    df = db.execute_query(query, (season, limit))
-    return df
-
+    ORDER BY pss."{stat}" DESC
+    LIMIT :limit
+"""
 
-@st.cache_data(ttl=3600)
-def load_player_career_stats(player_name: str):
-    """Load career statistics for a player"""
-    db = get_db_connection()
+# One statement per whitelisted column, built once at import
+_LEADERS_STMTS = {stat: text(_LEADERS_SQL.format(stat=stat)) for stat in LEADER_STATS}
 
-    query = """
+_CAREER_STMT = text(
+    """
     SELECT
-        s.season_id,
+        pss.season_id,
         t.team_abbreviation,
         pss.games_played,
         pss.ppg,
@@ -109,38 +115,81 @@ def load_player_career_stats(player_name: str):
     FROM player_season_stats pss
     JOIN dim_players p ON pss.player_key = p.player_key
     JOIN dim_teams t ON pss.team_key = t.team_key
-    JOIN dim_seasons s ON pss.season_key = s.season_key
-    WHERE p.player_name = %s
-    ORDER BY s.season_id DESC
+    WHERE p.player_name = :player_name
+    ORDER BY pss.season_id DESC
     """
+)
+
+# Top teams per conference, ranked server-side so only those rows are returned
+_STANDINGS_STMT = text(
+    """
+    WITH standings AS (
+        SELECT
+            t.team_name,
+            t.conference,
+            t.division,
+            tss.wins,
+            tss.losses,
+            ROUND(tss.wins::NUMERIC / NULLIF(tss.wins + tss.losses, 0), 3) as win_pct,
+            tss.offensive_rating,
+            tss.defensive_rating,
+            tss.net_rating
+        FROM team_season_stats tss
+        JOIN dim_teams t ON tss.team_key = t.team_key
+        WHERE tss.season_id = :season
+    ),
+    ranked AS (
+        SELECT
+            standings.*,
+            ROW_NUMBER() OVER (
+                PARTITION BY conference ORDER BY win_pct DESC NULLS LAST
+            ) as conference_rank
+        FROM standings
+    )
+    SELECT *
+    FROM ranked
+    WHERE conference_rank <= :top_n
+    ORDER BY conference, conference_rank
+    """
+)
+
 
-    df = db.execute_query(query, (player_name,))
+@st.cache_resource
+def get_db_connection():
+    """Get database connection (cached)"""
+    return DatabaseConnection()
+
+
+@st.cache_data(ttl=3600)
+def load_league_leaders(stat: str, season: str = "2024-25", limit: int = 10):
+    """Load league leaders for a specific stat"""
+    if stat not in _LEADERS_STMTS:
+        raise ValueError(f"Unsupported leaderboard stat: {stat}")
+
+    db = get_db_connection()
+    df = db.execute_query(
+        _LEADERS_STMTS[stat], {"season": season, "limit": limit}, dtype_backend=QUERY_DTYPE_BACKEND
+    )
     return df
 
 
 @st.cache_data(ttl=3600)
-def load_team_standings(season: str = "2024-25"):
-    """Load current standings"""
+def load_player_career_stats(player_name: str):
+    """Load career statistics for a player"""
     db = get_db_connection()
+    df = db.execute_query(
+        _CAREER_STMT, {"player_name": player_name}, dtype_backend=QUERY_DTYPE_BACKEND
+    )
+    return df
 
-    query = """
-    SELECT
-        t.team_name,
-        t.conference,
-        t.division,
-        tss.wins,
-        tss.losses,
-        ROUND(tss.wins::NUMERIC / (tss.wins + tss.losses), 3) as win_pct,
-        tss.offensive_rating,
-        tss.defensive_rating,
-        tss.net_rating
-    FROM team_season_stats tss
-    JOIN dim_teams t ON tss.team_key = t.team_key
-    WHERE tss.season_id = %s
-    ORDER BY t.conference, win_pct DESC
-    """
 
-    df = db.execute_query(query, (season,))
+@st.cache_data(ttl=3600)
+def load_team_standings(season: str = "2024-25", top_n: int = 8):
+    """Load current standings (top ``top_n`` teams of each conference)"""
+    db = get_db_connection()
+    df = db.execute_query(
+        _STANDINGS_STMT, {"season": season, "top_n": top_n}, dtype_backend=QUERY_DTYPE_BACKEND
+    )
     return df
 
 
@@ -218,7 +267,7 @@ def show_home_page(season: str):
 
     with col1:
         st.markdown("##### Eastern Conference")
-        east = standings[standings["conference"] == "East"].head(8)
+        east = standings[standings["conference"] == "East"]
         st.dataframe(
             east[["team_name", "wins", "losses", "win_pct", "net_rating"]],
             hide_index=True,
@@ -227,7 +276,7 @@ def show_home_page(season: str):
 
     with col2:
         st.markdown("##### Western Conference")
-        west = standings[standings["conference"] == "West"].head(8)
+        west = standings[standings["conference"] == "West"]
         st.dataframe(
             west[["team_name", "wins", "losses", "win_pct", "net_rating"]],
             hide_index=True,
@@ -242,23 +291,9 @@ def show_league_leaders_page(season: str):
     st.markdown(f"### Season {season}")
 
     # Stat selector
-    stat_category = st.selectbox(
-        "Select Stat Category",
-        ["Points", "Rebounds", "Assists", "Steals", "Blocks", "PER", "Win Shares"],
-    )
-
-    # Map display names to database columns
-    stat_mapping = {
-        "Points": "ppg",
-        "Rebounds": "rpg",
-        "Assists": "apg",
-        "Steals": "spg",
-        "Blocks": "bpg",
-        "PER": "per",
-        "Win Shares": "win_shares",
-    }
+    stat_category = st.selectbox("Select Stat Category", list(LEADER_STAT_COLUMNS))
 
-    stat_col = stat_mapping[stat_category]
+    stat_col = LEADER_STAT_COLUMNS[stat_category]
 
     # Load and display leaders
     leaders = load_league_leaders(stat_col, season, limit=15)
@@ -312,31 +347,31 @@ def show_player_comparison_page(season: str):
         # Display comparison metrics
         st.subheader("Season Averages Comparison")
 
-        # Create comparison dataframe (mock data for now)
-        comparison_data = {
-            "Stat": ["PPG", "RPG", "APG", "FG%", "PER", "Win Shares"],
-            player1: [27.1, 7.5, 7.3, 0.506, 25.7, 8.5],
-            player2: [29.4, 5.1, 6.2, 0.459, 24.1, 7.2],
-            player3: [28.6, 6.7, 5.0, 0.537, 28.3, 9.8],
-        }
+        # Comparison values, one row per selected player (mock data for now)
+        values = np.asarray(
+            [
+                [27.1, 7.5, 7.3, 0.506, 25.7, 8.5],
+                [29.4, 5.1, 6.2, 0.459, 24.1, 7.2],
+                [28.6, 6.7, 5.0, 0.537, 28.3, 9.8],
+            ]
+        )
+        # Selecting the same player twice would give duplicate column names
+        selected = list(dict.fromkeys([player1, player2, player3]))
+        values = values[: len(selected)]
 
-        df = pd.DataFrame(comparison_data)
+        df = pd.DataFrame(values.T, columns=selected)
+        df.insert(0, "Stat", COMPARISON_STATS)
 
         # Display as table
         st.dataframe(df, hide_index=True, use_container_width=True)
 
         # Radar chart
-        fig = go.Figure()
-
-        for player in [player1, player2, player3]:
-            fig.add_trace(
-                go.Scatterpolar(
-                    r=df[player].tolist(),
-                    theta=df["Stat"].tolist(),
-                    fill="toself",
-                    name=player,
-                )
-            )
+        fig = go.Figure(
+            [
+                go.Scatterpolar(r=row, theta=COMPARISON_STATS, fill="toself", name=player)
+                for player, row in zip(selected, values)
+            ]
+        )
 
         fig.update_layout(
             polar=dict(radialaxis=dict(visible=True)),
@@ -1,20 +1,16 @@
 """
 Test fixtures - sample data for unit tests
 Provides realistic NBA stat data for testing.
-"""
-
 
-def get_sample_raw_player_stat():
-    """
-    Sample raw player stat from NBA API (before transformation).
+The records are built once at import as read-only mappings; each getter returns
+a fresh shallow copy, so tests can mutate what they get (all values are
+immutable scalars).
+"""
 
-    This represents what comes directly from the NBA API.
-    Uses the actual field names from the API.
+from types import MappingProxyType
 
-    Returns:
-        Dictionary with raw API field names
-    """
-    return {
+_RAW_PLAYER_STAT = MappingProxyType(
+    {
         "gameId": "0022400123",
         "teamId": 1610612752,
         "personId": 203507,
@@ -51,20 +47,10 @@ def get_sample_raw_player_stat():
         "pace": 98.5,
         "PIE": 0.215,
     }
+)
 
-
-def get_sample_transformed_player_stat():
-    """
-    Sample transformed player stat (after transformation).
-
-    This represents data after going through NBATransformer.
-    Uses your database schema field names.
-    Includes all metrics already calculated by the API.
-
-    Returns:
-        Dictionary with transformed field names matching your schema
-    """
-    return {
+_TRANSFORMED_PLAYER_STAT = MappingProxyType(
+    {
         "game_id": "0022400123",
         "team_id": 1610612752,
         "player_id": 203507,
@@ -108,37 +94,18 @@ def get_sample_transformed_player_stat():
         "turnover_ratio": None,
         "raw_data": "{}",
     }
+)
 
+_TRANSFORMED_STAT_WITHOUT_TS = MappingProxyType(
+    {
+        **_TRANSFORMED_PLAYER_STAT,
+        "true_shooting_pct": None,
+        "effective_fg_pct": None,
+    }
+)
 
-def get_sample_transformed_stat_without_ts():
-    """
-    Sample transformed stat with missing true_shooting_pct and effective_fg_pct.
-
-    This simulates cases where the NBA API doesn't provide these metrics,
-    forcing your code to calculate them.
-
-    Used to test that calculate_advanced_metrics() properly calculates
-    missing metrics.
-
-    Returns:
-        Dictionary with None values for calculated metrics
-    """
-    stat = get_sample_transformed_player_stat()
-    stat["true_shooting_pct"] = None
-    stat["effective_fg_pct"] = None
-    return stat
-
-
-def get_sample_minimal_stat():
-    """
-    Minimal player stat with only required fields.
-
-    Used to test that your code handles missing optional fields.
-
-    Returns:
-        Dictionary with minimal required fields
-    """
-    return {
+_MINIMAL_STAT = MappingProxyType(
+    {
         "game_id": "0022400123",
         "team_id": 1610612752,
         "player_id": 203507,
@@ -152,18 +119,10 @@ def get_sample_minimal_stat():
         "true_shooting_pct": None,
         "effective_fg_pct": None,
     }
+)
 
-
-def get_sample_zero_stats():
-    """
-    Player stat with all zeros (DNP - Did Not Play scenario).
-
-    Used to test edge cases where player didn't play.
-
-    Returns:
-        Dictionary with zero values
-    """
-    return {
+_ZERO_STATS = MappingProxyType(
+    {
         "game_id": "0022400123",
         "team_id": 1610612752,
         "player_id": 203507,
@@ -188,6 +147,151 @@ def get_sample_zero_stats():
         "true_shooting_pct": None,
         "effective_fg_pct": None,
     }
+)
+
+_GAME_DATA = MappingProxyType(
+    {
+        "GAME_ID": "0022400123",
+        "GAME_DATE": "2024-12-15",
+        "HOME_TEAM_ID": 1610612752,
+        "VISITOR_TEAM_ID": 1610612738,
+        "SEASON": "2024-25",
+        "HOME_TEAM_SCORE": 115,
+        "VISITOR_TEAM_SCORE": 108,
+    }
+)
+
+_RAW_GAME = MappingProxyType(
+    {
+        "SEASON_ID": "22024",
+        "TEAM_ID": 1610612752,
+        "TEAM_ABBREVIATION": "NYK",
+        "TEAM_NAME": "New York Knicks",
+        "GAME_ID": "0022400123",
+        "GAME_DATE": "2024-12-15",
+        "MATCHUP": "NYK vs. BOS",
+        "WL": "W",
+        "MIN": 240,
+        "PTS": 115,
+        "FGM": 42,
+        "FGA": 85,
+        "FG_PCT": 0.494,
+        "FG3M": 12,
+        "FG3A": 33,
+        "FG3_PCT": 0.364,
+        "FTM": 19,
+        "FTA": 24,
+        "FT_PCT": 0.792,
+        "OREB": 10,
+        "DREB": 35,
+        "REB": 45,
+        "AST": 25,
+        "STL": 7,
+        "BLK": 5,
+        "TOV": 12,
+        "PF": 18,
+        "PLUS_MINUS": 7.0,
+    }
+)
+
+_TEAM_STATS = MappingProxyType(
+    {
+        "team_id": 1610612752,
+        "game_id": "0022400123",
+        "team_fga": 85,
+        "team_fta": 24,
+        "team_tov": 12,
+        "team_min": 240.0,
+        "team_oreb": 10,
+        "team_dreb": 35,
+        "team_points": 115,
+        "team_ast": 25,
+    }
+)
+
+
+def get_sample_raw_player_stat():
+    """
+    Sample raw player stat from NBA API (before transformation).
+
+    This represents what comes directly from the NBA API.
+    Uses the actual field names from the API.
+
+    Returns:
+        Dictionary with raw API field names
+    """
+    return dict(_RAW_PLAYER_STAT)
+
+
+def get_sample_transformed_player_stat():
+    """
+    Sample transformed player stat (after transformation).
+
+    This represents data after going through NBATransformer.
+    Uses your database schema field names.
+    Includes all metrics already calculated by the API.
+
+    Returns:
+        Dictionary with transformed field names matching your schema
+    """
+    return dict(_TRANSFORMED_PLAYER_STAT)
+
+
+def get_sample_transformed_stat_without_ts():
+    """
+    Sample transformed stat with missing true_shooting_pct and effective_fg_pct.
+
+    This simulates cases where the NBA API doesn't provide these metrics,
+    forcing your code to calculate them.
+
+    Used to test that calculate_advanced_metrics() properly calculates
+    missing metrics.
+
+    Returns:
+        Dictionary with None values for calculated metrics
+    """
+    return dict(_TRANSFORMED_STAT_WITHOUT_TS)
+
+
+def get_sample_stat_batch(fields, rows):
+    """
+    Batch of transformed stats without true_shooting_pct / effective_fg_pct.
+
+    Each record is ``get_sample_transformed_stat_without_ts()`` with ``fields``
+    set to the values of one of ``rows``.
+
+    Args:
+        fields: Names of the fields to vary
+        rows: One tuple of values (in ``fields`` order) per record
+
+    Returns:
+        List of dictionaries, one per row
+    """
+    return [{**_TRANSFORMED_STAT_WITHOUT_TS, **dict(zip(fields, row))} for row in rows]
+
+
+def get_sample_minimal_stat():
+    """
+    Minimal player stat with only required fields.
+
+    Used to test that your code handles missing optional fields.
+
+    Returns:
+        Dictionary with minimal required fields
+    """
+    return dict(_MINIMAL_STAT)
+
+
+def get_sample_zero_stats():
+    """
+    Player stat with all zeros (DNP - Did Not Play scenario).
+
+    Used to test edge cases where player didn't play.
+
+    Returns:
+        Dictionary with zero values
+    """
+    return dict(_ZERO_STATS)
 
 
 def get_sample_game_data():
@@ -199,15 +303,19 @@ def get_sample_game_data():
     Returns:
         Dictionary with game information
     """
-    return {
-        "GAME_ID": "0022400123",
-        "GAME_DATE": "2024-12-15",
-        "HOME_TEAM_ID": 1610612752,
-        "VISITOR_TEAM_ID": 1610612738,
-        "SEASON": "2024-25",
-        "HOME_TEAM_SCORE": 115,
-        "VISITOR_TEAM_SCORE": 108,
-    }
+    return dict(_GAME_DATA)
+
+
+def get_sample_raw_game():
+    """
+    Sample raw team game row from the NBA API (LeagueGameFinder).
+
+    Used to test the game transformer.
+
+    Returns:
+        Dictionary with raw API field names
+    """
+    return dict(_RAW_GAME)
 
 
 def get_sample_team_stats():
@@ -220,15 +328,4 @@ def get_sample_team_stats():
     Returns:
         Dictionary with team statistics
     """
-    return {
-        "team_id": 1610612752,
-        "game_id": "0022400123",
-        "team_fga": 85,
-        "team_fta": 24,
-        "team_tov": 12,
-        "team_min": 240.0,
-        "team_oreb": 10,
-        "team_dreb": 35,
-        "team_points": 115,
-        "team_ast": 25,
-    }
+    return dict(_TEAM_STATS)
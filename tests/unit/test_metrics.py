@@ -2,19 +2,30 @@
 Unit tests for advanced metrics calculation
 """
 
-from src.analytics.metrics import AdvancedMetricsCalculator, calculate_advanced_metrics
+import pandas as pd
+
+from src.analytics.metrics import (
+    AdvancedMetricsCalculator,
+    PlayerStatRow,
+    calculate_advanced_metrics,
+)
 from tests.fixtures.sample_data import (
+    get_sample_stat_batch,
     get_sample_transformed_player_stat,
     get_sample_transformed_stat_without_ts,
 )
 
+# Fields varied by the batch tests: (points, FGA, FTA) per record
+SHOOTING_FIELDS = ("points", "field_goals_attempted", "free_throws_attempted")
+
 
 class TestAdvancedMetricsCalculator:
     """Test suite for AdvancedMetricsCalculator class methods"""
 
-    def setup_method(self):
-        """Setup before each test"""
-        self.calculator = AdvancedMetricsCalculator()
+    @classmethod
+    def setup_class(cls):
+        """Setup once for the class (the calculator is stateless)"""
+        cls.calculator = AdvancedMetricsCalculator()
 
     def test_calculate_true_shooting_pct_normal(self):
         """Test true shooting percentage with normal values"""
@@ -127,6 +138,28 @@ class TestAdvancedMetricsCalculator:
 
         assert result == 0.0
 
+    def test_calculate_per_no_field_goals_made(self):
+        """Test PER with assists but no made field goals (no division by zero)"""
+        result = self.calculator.calculate_per(
+            min_played=2.0,
+            fg3m=0,
+            ast=4,
+            fgm=0,
+            ftm=8,
+            oreb=1,
+            dreb=2,
+            stl=1,
+            blk=0,
+            fga=3,
+            fta=8,
+            tov=1,
+            pf=1,
+        )
+
+        # With fgm == 0 the assist/FGM ratio counts as 0, so every free throw
+        # is worth a full point: uPER = (8/3 + 8 + 1 + 0.5 + 1 + 4 - 3 - 1 - 1) / 2
+        assert result == 0.9
+
     def test_calculate_box_plus_minus_positive(self):
         """Test box plus minus with good stats"""
         result = self.calculator.calculate_box_plus_minus(
@@ -369,6 +402,33 @@ class TestCalculateAdvancedMetrics:
         assert isinstance(result, list)
         assert len(result) == 0
 
+    def test_matches_scalar_calculator(self):
+        """Test that vectorized results match the scalar calculator formulas"""
+        sample_stats = get_sample_stat_batch(
+            (
+                "points",
+                "field_goals_made",
+                "field_goals_attempted",
+                "three_pointers_made",
+                "free_throws_attempted",
+            ),
+            [(20, 8, 15, 2, 4), (0, 0, 0, 0, 0), (31, 11, 19, 5, 7)],
+        )
+
+        result = calculate_advanced_metrics(sample_stats)
+
+        calculator = AdvancedMetricsCalculator()
+        for stat in result:
+            expected_ts = calculator.calculate_true_shooting_pct(
+                stat["points"], stat["field_goals_attempted"], stat["free_throws_attempted"]
+            )
+            expected_efg = calculator.calculate_effective_fg_pct(
+                stat["field_goals_made"], stat["three_pointers_made"], stat["field_goals_attempted"]
+            )
+
+            assert stat["true_shooting_pct"] == expected_ts
+            assert stat["effective_fg_pct"] == expected_efg
+
     def test_metrics_are_rounded(self):
         """Test that calculated metrics are properly rounded"""
         sample_stat = get_sample_transformed_stat_without_ts()
@@ -378,5 +438,97 @@ class TestCalculateAdvancedMetrics:
         ts_pct = result[0]["true_shooting_pct"]
         efg_pct = result[0]["effective_fg_pct"]
 
-        assert len(str(ts_pct).split(".")[-1]) <= 3
-        assert len(str(efg_pct).split(".")[-1]) <= 3
+        for value in (ts_pct, efg_pct):
+            assert isinstance(value, float)
+            assert abs(value - round(value, 3)) < 1e-12
+
+
+class TestCalculateAdvancedMetricsDataFrame:
+    """Test suite for the vectorized DataFrame path of calculate_advanced_metrics"""
+
+    def test_returns_dataframe(self):
+        """Test that DataFrame input returns a DataFrame"""
+        df = pd.DataFrame([get_sample_transformed_stat_without_ts()])
+
+        result = calculate_advanced_metrics(df)
+
+        assert isinstance(result, pd.DataFrame)
+        assert len(result) == 1
+
+    def test_matches_record_path(self):
+        """Test that vectorized results match the per-record calculation"""
+        records = calculate_advanced_metrics([get_sample_transformed_stat_without_ts()])
+        df = calculate_advanced_metrics(pd.DataFrame([get_sample_transformed_stat_without_ts()]))
+
+        assert df["true_shooting_pct"].iloc[0] == records[0]["true_shooting_pct"]
+        assert df["effective_fg_pct"].iloc[0] == records[0]["effective_fg_pct"]
+
+    def test_does_not_override_existing_values(self):
+        """Test that metrics provided by the API are preserved"""
+        stats = [get_sample_transformed_player_stat(), get_sample_transformed_stat_without_ts()]
+        stats[0]["true_shooting_pct"] = 0.650
+
+        result = calculate_advanced_metrics(pd.DataFrame(stats))
+
+        assert result["true_shooting_pct"].iloc[0] == 0.650
+        assert result["true_shooting_pct"].notna().all()
+        assert result["effective_fg_pct"].notna().all()
+
+    def test_handles_zero_attempts(self):
+        """Test that zero-attempt rows get 0.0 instead of dividing by zero"""
+        stat = get_sample_transformed_stat_without_ts()
+        stat["field_goals_attempted"] = 0
+        stat["free_throws_attempted"] = 0
+        stat["points"] = 0
+
+        result = calculate_advanced_metrics(pd.DataFrame([stat]))
+
+        assert result["true_shooting_pct"].iloc[0] == 0.0
+        assert result["effective_fg_pct"].iloc[0] == 0.0
+
+    def test_metrics_are_rounded_once_per_batch(self):
+        """Test that the whole batch comes back rounded to 3 decimals"""
+        stats = get_sample_stat_batch(SHOOTING_FIELDS, [(17, 13, 5), (23, 19, 7), (9, 11, 3)])
+
+        result = calculate_advanced_metrics(pd.DataFrame(stats))
+
+        for column in ("true_shooting_pct", "effective_fg_pct"):
+            assert (result[column] == result[column].round(3)).all()
+
+    def test_parallel_chunks_match_single_pass(self, monkeypatch):
+        """Test that splitting a large batch across threads gives the same results"""
+        stats = get_sample_stat_batch(
+            SHOOTING_FIELDS, [(17, 13, 5), (23, 19, 7), (9, 11, 3), (0, 0, 0)]
+        )
+
+        expected = calculate_advanced_metrics(pd.DataFrame(stats))
+
+        monkeypatch.setattr("src.analytics.metrics.PARALLEL_THRESHOLD", 1)
+        result = calculate_advanced_metrics(pd.DataFrame(stats))
+
+        pd.testing.assert_frame_equal(result, expected)
+
+
+class TestCalculateAdvancedMetricsRows:
+    """Test suite for the PlayerStatRow path of calculate_advanced_metrics"""
+
+    def test_matches_record_path(self):
+        """Test that typed rows get the same metrics as record dictionaries"""
+        stat = get_sample_transformed_stat_without_ts()
+        row = PlayerStatRow(**{field: stat[field] for field in PlayerStatRow._fields[:5]})
+
+        records = calculate_advanced_metrics([stat])
+        rows = calculate_advanced_metrics([row])
+
+        assert isinstance(rows[0], PlayerStatRow)
+        assert rows[0].true_shooting_pct == records[0]["true_shooting_pct"]
+        assert rows[0].effective_fg_pct == records[0]["effective_fg_pct"]
+
+    def test_does_not_override_existing_values(self):
+        """Test that metrics already set on a row are preserved"""
+        row = PlayerStatRow(points=20, field_goals_made=8, field_goals_attempted=15)
+
+        result = calculate_advanced_metrics([row._replace(true_shooting_pct=0.650)])
+
+        assert result[0].true_shooting_pct == 0.650
+        assert result[0].effective_fg_pct is not None
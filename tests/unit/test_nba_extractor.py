@@ -0,0 +1,108 @@
+"""
+Unit tests for the NBA API extractor (network mocked at the HTTP adapter)
+"""
+
+import io
+import json
+
+import pytest
+from nba_api.stats.library.http import NBAStatsHTTP
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+from src.etl.extractors.nba_extractor import NBAExtractor
+from src.utils.config import Config
+
+ROSTER_RESPONSE = {
+    "resource": "commonteamroster",
+    "parameters": {"TeamID": 1610612752, "Season": "2024-25"},
+    "resultSets": [
+        {
+            "name": "CommonTeamRoster",
+            "headers": ["TeamID", "PLAYER", "PLAYER_ID"],
+            "rowSet": [
+                [1610612752, "Jalen Brunson", 1628973],
+                [1610612752, "Josh Hart", 1628404],
+            ],
+        },
+        {"name": "Coaches", "headers": ["TEAM_ID", "COACH_NAME"], "rowSet": []},
+    ],
+}
+
+
+@pytest.fixture
+def sent_requests(monkeypatch):
+    """Serve ROSTER_RESPONSE for every request and record what was sent"""
+    sent = []
+
+    def send(adapter, request, **kwargs):
+        sent.append(request)
+        raw = HTTPResponse(
+            body=io.BytesIO(json.dumps(ROSTER_RESPONSE).encode()),
+            headers={"Content-Type": "application/json"},
+            status=200,
+            preload_content=False,
+        )
+        return adapter.build_response(request, raw)
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+    return sent
+
+
+@pytest.fixture
+def fresh_extractor_state(monkeypatch):
+    """Give each test its own shared session and limiter"""
+    monkeypatch.setattr(NBAExtractor, "_http_session", None)
+    monkeypatch.setattr(NBAExtractor, "_limiter", None)
+    monkeypatch.setattr(NBAStatsHTTP, "_session", None)
+
+
+@pytest.mark.usefixtures("fresh_extractor_state")
+class TestNBAExtractor:
+    """Test suite for NBAExtractor construction and shared HTTP session"""
+
+    def test_constructs_with_shared_session(self, monkeypatch, sent_requests):
+        """Test the extractor installs one shared session in nba_api"""
+        monkeypatch.setattr(Config, "NBA_API_CACHE_PATH", "")
+
+        first = NBAExtractor()
+        second = NBAExtractor()
+
+        assert NBAStatsHTTP.get_session() is NBAExtractor._get_http_session()
+        assert first._limiter is second._limiter
+        assert sent_requests == []
+
+    def test_shared_limiter_keeps_lowest_rate(self, monkeypatch):
+        """Test a lower rate_limit tightens the shared budget and a higher one doesn't"""
+        monkeypatch.setattr(Config, "NBA_API_CACHE_PATH", "")
+
+        NBAExtractor(rate_limit=600)
+        NBAExtractor(rate_limit=120)
+        NBAExtractor(rate_limit=300)
+
+        assert NBAExtractor._limiter.rate == 120
+
+    def test_requests_go_through_shared_session(self, monkeypatch, sent_requests):
+        """Test endpoint calls are sent through the mocked session"""
+        monkeypatch.setattr(Config, "NBA_API_CACHE_PATH", "")
+
+        roster = NBAExtractor().get_team_roster(1610612752)
+
+        assert [player["PLAYER_ID"] for player in roster] == [1628973, 1628404]
+        assert len(sent_requests) == 1
+        assert "commonteamroster" in sent_requests[0].url
+
+    def test_repeated_call_is_served_from_cache(self, monkeypatch, tmp_path, sent_requests):
+        """Test a second identical request is answered by the response cache"""
+        monkeypatch.setattr(Config, "NBA_API_CACHE_PATH", str(tmp_path / "nba_api_cache"))
+        extractor = NBAExtractor()
+
+        first = extractor.get_team_roster(1610612752)
+        second = extractor.get_team_roster(1610612752)
+
+        assert first == second
+        assert len(sent_requests) == 1
+        session = NBAExtractor._get_http_session()
+        response = session.get(sent_requests[0].url, headers=NBAStatsHTTP.headers)
+        assert response.from_cache
+        assert len(sent_requests) == 1
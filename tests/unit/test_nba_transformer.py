@@ -0,0 +1,157 @@
+"""
+Unit tests for the NBA data transformer
+"""
+
+import pandas as pd
+
+from src.etl.transformers.nba_transformer import NBATransformer
+from tests.fixtures.sample_data import get_sample_raw_game, get_sample_raw_player_stat
+
+
+class TestTransformGames:
+    """Test suite for NBATransformer.transform_games"""
+
+    @classmethod
+    def setup_class(cls):
+        """Setup once for the class (the transformer is stateless)"""
+        cls.transformer = NBATransformer()
+
+    def test_transforms_game_record(self):
+        """Test a raw game row is mapped to the staging columns"""
+        result = self.transformer.transform_games([get_sample_raw_game()])
+
+        assert len(result) == 1
+        game = result[0]
+        assert game["game_id"] == "0022400123"
+        assert game["team_id"] == 1610612752
+        assert game["game_date"] == "2024-12-15"
+        assert game["is_home"]
+        assert game["points"] == 115
+
+    def test_skips_game_without_game_id(self):
+        """Test rows with a missing GAME_ID are dropped"""
+        game = get_sample_raw_game()
+        del game["GAME_ID"]
+        other = get_sample_raw_game()
+        other["GAME_ID"] = None
+
+        result = self.transformer.transform_games([game, other, get_sample_raw_game()])
+
+        assert [g["game_id"] for g in result] == ["0022400123"]
+
+    def test_skips_game_with_invalid_team_id(self):
+        """Test rows with a missing or non-numeric TEAM_ID are dropped"""
+        missing = get_sample_raw_game()
+        missing["TEAM_ID"] = None
+        invalid = get_sample_raw_game()
+        invalid["TEAM_ID"] = "not a team"
+
+        result = self.transformer.transform_games([missing, invalid, get_sample_raw_game()])
+
+        assert [g["team_id"] for g in result] == [1610612752]
+
+    def test_skipped_rows_keep_raw_data_aligned(self):
+        """Test raw_data still belongs to the row it is stored with"""
+        missing = get_sample_raw_game()
+        missing["TEAM_ID"] = None
+        away = get_sample_raw_game()
+        away.update(TEAM_ID=1610612738, MATCHUP="BOS @ NYK")
+
+        result = self.transformer.transform_games([missing, away])
+
+        assert len(result) == 1
+        assert '"TEAM_ID":1610612738' in result[0]["raw_data"]
+        assert not result[0]["is_home"]
+
+    def test_dataframe_input_skips_invalid_rows(self):
+        """Test the DataFrame path drops the same rows as the list path"""
+        missing = get_sample_raw_game()
+        missing["GAME_ID"] = None
+        games = pd.DataFrame([missing, get_sample_raw_game()])
+
+        result = self.transformer.transform_games(games)
+
+        assert isinstance(result, pd.DataFrame)
+        assert result["game_id"].tolist() == ["0022400123"]
+        assert len(result["raw_data"]) == 1
+
+    def test_raw_data_matches_between_paths(self):
+        """Test list and DataFrame input store the same raw_data JSON"""
+        game = get_sample_raw_game()
+        game["GAME_DATE"] = "12/15/2024"
+        other = get_sample_raw_game()
+        other.update(TEAM_ID=1610612738, MATCHUP="BOS @ NYK", PLUS_MINUS=None)
+        games = pd.DataFrame([game, other])
+
+        from_frame = self.transformer.transform_games(games)
+        from_records = self.transformer.transform_games(games.to_dict("records"))
+
+        assert from_frame["raw_data"].tolist() == [g["raw_data"] for g in from_records]
+        assert '"GAME_DATE":"12/15/2024"' in from_records[0]["raw_data"]
+        assert '"PTS":115,' in from_records[0]["raw_data"]
+
+    def test_all_rows_invalid(self):
+        """Test a batch without any valid row gives an empty result"""
+        game = get_sample_raw_game()
+        game["GAME_ID"] = None
+
+        assert self.transformer.transform_games([game]) == []
+
+
+class TestTransformPlayerStats:
+    """Test suite for NBATransformer.transform_player_stats"""
+
+    @classmethod
+    def setup_class(cls):
+        """Setup once for the class (the transformer is stateless)"""
+        cls.transformer = NBATransformer()
+
+    def test_transforms_player_stat(self):
+        """Test a raw box score row is mapped to the staging columns"""
+        result = self.transformer.transform_player_stats([get_sample_raw_player_stat()])
+
+        assert len(result) == 1
+        stat = result[0]
+        assert stat["player_id"] == 203507
+        assert stat["player_name"] == "Giannis Antetokounmpo"
+        assert stat["jersey_num"] == "34"
+        assert stat["minutes_played"] == 35.4
+
+    def test_skips_stat_without_player_id(self):
+        """Test records with a missing or invalid personId are dropped"""
+        missing = get_sample_raw_player_stat()
+        missing["personId"] = None
+        invalid = get_sample_raw_player_stat()
+        invalid["personId"] = "unknown"
+
+        result = self.transformer.transform_player_stats(
+            [missing, invalid, get_sample_raw_player_stat()]
+        )
+
+        assert [s["player_id"] for s in result] == [203507]
+        assert len(result) == 1
+
+    def test_skips_stat_without_game_or_team(self):
+        """Test records with a missing gameId or teamId are dropped"""
+        no_game = get_sample_raw_player_stat()
+        del no_game["gameId"]
+        no_team = get_sample_raw_player_stat()
+        no_team["teamId"] = None
+
+        result = self.transformer.transform_player_stats(
+            [no_game, no_team, get_sample_raw_player_stat()], as_frame=True
+        )
+
+        assert result["game_id"].tolist() == ["0022400123"]
+        assert result["team_id"].tolist() == [1610612752]
+
+    def test_missing_jersey_num_is_none(self):
+        """Test a missing jersey number stays None"""
+        stat = get_sample_raw_player_stat()
+        del stat["jerseyNum"]
+        other = get_sample_raw_player_stat()
+        other["jerseyNum"] = None
+
+        result = self.transformer.transform_player_stats([stat, other])
+
+        assert [s["jersey_num"] for s in result] == [None, None]